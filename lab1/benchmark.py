@@ -0,0 +1,268 @@
+"""
+Reproducible benchmark of the sorting algorithms.
+
+Every timed run sorts a fresh copy of its input, so in-place sorts never
+hand already sorted data to the next algorithm. Inputs are drawn from a
+seeded generator per (distribution, length), runs are timed with
+perf_counter_ns after warm-up runs, and the results are written as JSON.
+
+Example usage:
+    $ python benchmark.py --lengths 1000 10000 --output bench.json
+    $ python benchmark.py --lengths 1000 10000 --compare bench.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+
+from sorts.heap import heap_sort
+from sorts.quicksort import quick_sort
+from sorts.selection import selection_sort
+from sorts.radix import radix_sort
+from sorts.numpy_sort import numpy_sort
+from sorts.merge import merge_sort
+from sorts.instrument import measure_costs
+
+from data.read import read_plants_table
+
+ALGORITHMS = {
+    "quick_sort": quick_sort,
+    "heap_sort": heap_sort,
+    "selection_sort": selection_sort,
+    "radix_sort": radix_sort,
+    "numpy_sort": numpy_sort,
+    "merge_sort": merge_sort,
+}
+# Квадратичные сортировки не запускаются на больших входах
+MAX_LENGTHS = {"selection_sort": 20000}
+DISTRIBUTIONS = ["random", "sorted", "reversed", "few_unique", "nearly_sorted"]
+# Доля переставленных пар в почти отсортированном входе
+NEARLY_SORTED_SWAPS = 0.01
+FEW_UNIQUE_VALUES = 4
+
+
+def make_input(data, length, distribution, seed=0):
+    """
+    Builds a benchmark input from the dataset.
+
+    Args:
+        data (list): Flowers or a FlowerTable.
+        length (int): Size of the input.
+        distribution (str): One of DISTRIBUTIONS.
+        seed (int): Seed of the generator.
+
+    Returns:
+        list: A new input of the same type as data.
+    """
+    if length > len(data):
+        raise ValueError(
+            "Length cannot be greater than the size of the input array"
+        )
+    rng = random.Random(f"{seed}-{distribution}-{length}")
+    items = rng.sample(list(data), length)
+
+    if distribution == "sorted":
+        items.sort()
+    elif distribution == "reversed":
+        items.sort(reverse=True)
+    elif distribution == "few_unique":
+        values = items[:FEW_UNIQUE_VALUES]
+        items = [rng.choice(values) for _ in range(length)]
+    elif distribution == "nearly_sorted":
+        items.sort()
+        for _ in range(int(length * NEARLY_SORTED_SWAPS)):
+            i, j = rng.randrange(length), rng.randrange(length)
+            items[i], items[j] = items[j], items[i]
+    elif distribution != "random":
+        raise ValueError(f"Unknown distribution: {distribution}")
+
+    if hasattr(data, "take"):
+        return data.take(items)
+    return items
+
+
+def time_sort(sort_func, data, repeats=5, warmup=1):
+    """
+    Times a sort on fresh copies of the data.
+
+    Args:
+        sort_func (callable): The in-place sort.
+        data (list): The input. It is never modified.
+        repeats (int): Number of timed runs.
+        warmup (int): Number of untimed runs before them.
+
+    Returns:
+        list: Durations of the timed runs in nanoseconds.
+    """
+    for _ in range(warmup):
+        sort_func(data.copy())
+
+    times = []
+    for _ in range(repeats):
+        copy = data.copy()
+        start_time = time.perf_counter_ns()
+        sort_func(copy)
+        times.append(time.perf_counter_ns() - start_time)
+    return times
+
+
+def summarize(times):
+    """
+    Reduces run durations to summary statistics.
+
+    Args:
+        times (list): Durations in nanoseconds.
+
+    Returns:
+        dict: median_ns, p95_ns, min_ns and mean_ns.
+    """
+    ordered = sorted(times)
+    return {
+        "median_ns": statistics.median(ordered),
+        "p95_ns": ordered[math.ceil(0.95 * len(ordered)) - 1],
+        "min_ns": ordered[0],
+        "mean_ns": statistics.fmean(ordered),
+    }
+
+
+def run_benchmark(
+    data,
+    algorithms=None,
+    lengths=(1000, 5000, 10000),
+    distributions=DISTRIBUTIONS,
+    repeats=5,
+    warmup=1,
+    seed=0,
+    instrument=False,
+    log=print,
+):
+    """
+    Benchmarks every algorithm on every distribution and length.
+
+    Args:
+        data (list): Flowers or a FlowerTable to draw the inputs from.
+        algorithms (list): Names from ALGORITHMS. Defaults to all of them.
+        lengths (list): Input sizes.
+        distributions (list): Names from DISTRIBUTIONS.
+        repeats (int): Timed runs per case.
+        warmup (int): Untimed runs per case.
+        seed (int): Seed of the inputs.
+        instrument (bool): Whether to add the counters of measure_costs,
+            collected in one extra untimed run.
+        log (callable): Receives one line per finished case.
+
+    Returns:
+        dict: JSON-serializable results with a "meta" and a "results" part.
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    results = []
+
+    for distribution in distributions:
+        for length in lengths:
+            case = make_input(data, length, distribution, seed)
+            for name in algorithms:
+                if length > MAX_LENGTHS.get(name, length):
+                    continue
+                times = time_sort(ALGORITHMS[name], case, repeats, warmup)
+                result = {
+                    "algorithm": name,
+                    "distribution": distribution,
+                    "length": length,
+                    **summarize(times),
+                    "runs_ns": times,
+                }
+                if instrument:
+                    result["costs"] = measure_costs(ALGORITHMS[name], case)
+                results.append(result)
+                log(
+                    f"{name} {distribution} {length}: "
+                    f"median {result['median_ns'] / 1e6:.3f} ms, "
+                    f"p95 {result['p95_ns'] / 1e6:.3f} ms"
+                )
+
+    return {
+        "meta": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "repeats": repeats,
+            "warmup": warmup,
+            "instrument": instrument,
+        },
+        "results": results,
+    }
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Finds cases whose median got slower than in the baseline.
+
+    Args:
+        results (dict): Output of run_benchmark.
+        baseline (dict): An earlier output of run_benchmark.
+        threshold (float): Allowed relative slowdown.
+
+    Returns:
+        list: Tuples (algorithm, distribution, length, old_ns, new_ns).
+    """
+    old = {
+        (r["algorithm"], r["distribution"], r["length"]): r["median_ns"]
+        for r in baseline["results"]
+    }
+    regressions = []
+    for r in results["results"]:
+        case = (r["algorithm"], r["distribution"], r["length"])
+        if case in old and r["median_ns"] > old[case] * (1 + threshold):
+            regressions.append((*case, old[case], r["median_ns"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sorting benchmark")
+    parser.add_argument("--data", default="data/plants.csv")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS))
+    parser.add_argument("--lengths", nargs="+", type=int, default=[1000, 5000, 10000])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=DISTRIBUTIONS)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--instrument", action="store_true", help="count comparisons, writes, calls and memory")
+    parser.add_argument("--output", default="bench.json")
+    parser.add_argument("--compare", metavar="BASELINE")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        read_plants_table(args.data),
+        algorithms=args.algorithms,
+        lengths=args.lengths,
+        distributions=args.distributions,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        seed=args.seed,
+        instrument=args.instrument,
+    )
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, distribution, length, old_ns, new_ns in regressions:
+            print(
+                f"REGRESSION {name} {distribution} {length}: "
+                f"{old_ns / 1e6:.3f} ms -> {new_ns / 1e6:.3f} ms"
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
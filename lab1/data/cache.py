@@ -0,0 +1,207 @@
+"""
+Binary sidecar cache for parsed plants datasets.
+
+Parsing the CSV with csv.DictReader and decoding every Cyrillic string is
+the slowest part of a run. After the first parse the FlowerTable is saved
+next to the CSV (``plants.csv`` -> ``plants.csv.bin``):
+
+    header      magic, version, CSV mtime_ns, size and BLAKE2b hash, rows
+    dictionary  number of strings, then (uint32 length, UTF-8 bytes) each
+    padding     up to 8 bytes
+    records     one little-endian uint64 packed key per row
+
+Later runs memory-map the file and copy the records into the table with a
+single memcpy, with no per-row work. The cache is used while the CSV keeps
+its mtime and size; if only the mtime changed, the content hash decides,
+and on a match the new mtime is written into the header, so the CSV is
+hashed once per touch rather than on every load.
+
+Example usage:
+    >>> table = read_plants_table("data/plants.csv")  # builds or loads the cache
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+from .table import FlowerTable
+
+MAGIC = b"FLWR"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxqqQ32s")
+LENGTH = struct.Struct("<I")
+
+
+def cache_path(csv_path):
+    return csv_path + ".bin"
+
+
+def load_table(csv_path, build):
+    """
+    Returns the table of the CSV, from the sidecar cache if it is valid.
+
+    Args:
+        csv_path (str): The CSV file.
+        build (callable): Parses the CSV into a FlowerTable on a cache miss.
+
+    Returns:
+        FlowerTable: The dataset.
+    """
+    path = cache_path(csv_path)
+    stat = os.stat(csv_path)
+
+    table = read_cache(path, csv_path, stat)
+    if table is not None:
+        return table
+
+    table = build(csv_path)
+    try:
+        write_cache(path, table, stat, file_hash(csv_path))
+    except OSError:
+        pass  # кэш необязателен, например каталог только для чтения
+    return table
+
+
+def read_cache(path, csv_path, stat):
+    """
+    Loads the sidecar file if it matches the CSV.
+
+    Returns:
+        FlowerTable: The dataset, or None if the cache is missing or stale.
+    """
+    try:
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                parsed = _parse(data, csv_path, stat)
+    except (OSError, ValueError, struct.error):
+        return None
+    if parsed is None:
+        return None
+
+    table, touched = parsed
+    if touched:
+        # Содержимое то же, запоминаем новое mtime, чтобы не хэшировать снова
+        try:
+            update_mtime(path, stat.st_mtime_ns)
+        except (OSError, struct.error):
+            pass
+    return table
+
+
+def write_cache(path, table, stat, digest):
+    """
+    Writes the table as a sidecar file, atomically replacing an old one.
+
+    Args:
+        path (str): The sidecar file.
+        table (FlowerTable): The dataset.
+        stat (os.stat_result): Stat of the CSV the table was built from.
+        digest (bytes): BLAKE2b hash of the CSV.
+    """
+    records = table
+    if sys.byteorder == "big":
+        records = table.copy()
+        records.byteswap()
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        write_header(
+            file, table.strings, len(table), stat.st_mtime_ns, stat.st_size, digest
+        )
+        records.tofile(file)
+    os.replace(tmp_path, path)
+
+
+def write_header(file, strings, count, mtime_ns=0, size=0, digest=bytes(32)):
+    """
+    Writes everything that precedes the records, including the padding.
+
+    A file that is not a sidecar of a CSV keeps the zero defaults.
+
+    Args:
+        file: Binary file opened for writing.
+        strings (list): The sorted string dictionary.
+        count (int): Number of records that follow.
+    """
+    file.write(HEADER.pack(MAGIC, VERSION, mtime_ns, size, count, digest))
+    file.write(LENGTH.pack(len(strings)))
+    written = HEADER.size + LENGTH.size
+    for s in strings:
+        encoded = s.encode("utf-8")
+        file.write(LENGTH.pack(len(encoded)))
+        file.write(encoded)
+        written += LENGTH.size + len(encoded)
+    file.write(b"\0" * (-written % 8))
+
+
+def update_mtime(path, mtime_ns):
+    """Rewrites the CSV mtime stored in the header of a sidecar file in place."""
+    with open(path, "r+b") as file:
+        fields = list(HEADER.unpack(file.read(HEADER.size)))
+        fields[2] = mtime_ns
+        file.seek(0)
+        file.write(HEADER.pack(*fields))
+
+
+def read_table(path):
+    """
+    Loads a binary plants file without checking it against a CSV.
+
+    Args:
+        path (str): The binary file, e.g. written by ``gen.py --format bin``.
+
+    Returns:
+        FlowerTable: The dataset.
+    """
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _load(data)
+
+
+def file_hash(path):
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _parse(data, csv_path, stat):
+    # Возвращает (таблица, устарело ли mtime в заголовке) или None
+    magic, version, mtime_ns, size, count, digest = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or size != stat.st_size:
+        return None
+    touched = mtime_ns != stat.st_mtime_ns
+    if touched and digest != file_hash(csv_path):
+        return None
+    return _load(data), touched
+
+
+def _load(data):
+    magic, version, _, _, count, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a plants binary file")
+
+    offset = HEADER.size
+    (n_strings,) = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    strings = []
+    for _ in range(n_strings):
+        (length,) = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        strings.append(str(data[offset:offset + length], "utf-8"))
+        offset += length
+    offset += -offset % 8
+
+    end = offset + count * 8
+    if end != len(data):
+        raise ValueError("Truncated plants cache")
+
+    table = FlowerTable(strings)
+    with memoryview(data) as view:
+        table.frombytes(view[offset:end])
+    if sys.byteorder == "big":
+        table.byteswap()
+    return table
@@ -1,32 +1,338 @@
+"""
+Seeded, streaming generator of plants datasets.
+
+Rows are generated with NumPy in fixed-size chunks and written straight to
+a CSV file or to the binary format of ``data.cache``, so the memory use
+does not depend on the number of rows. Every row is an index into the
+precomputed table of all (name, color, aroma, region) combinations, whose
+(name, color, aroma) part follows the Flower ordering, so ordered
+distributions are produced without sorting anything.
+
+Distributions:
+    - random: independent uniform rows;
+    - sorted / reversed: ascending / descending by the Flower ordering;
+    - organ_pipe: ascending first half, descending second half;
+    - few_unique: only a few distinct flowers;
+    - nearly_sorted: sorted with k random swaps;
+    - quicksort_killer: adversarial input for sorts.quicksort, adapted to
+      the 75 keys of the dataset (see _quicksort_killer).
+
+Example usage:
+    $ python -m data.gen --size 100000000 --output data/plants.csv --seed 1
+    $ python -m data.gen --size 1000000 --distribution organ_pipe --format bin --output data/plants.bin
+"""
+
+import argparse
 import csv
-import random
+import io
+
+import numpy as np
+
+from sorts.quicksort import INSERTION_THRESHOLD, NINTHER_THRESHOLD
+
+from .cache import write_header
+
+FLOWERS = ["Роза", "Тюльпан", "Пион", "Лилия", "Орхидея"]
+COLORS = ["Красный", "Желтый", "Розовый", "Белый", "Фиолетовый"]
+AROMAS = ["Сильный", "Умеренный", "Слабый"]
+REGIONS = ["Европа", "Азия", "Африка", "Америка", "Австралия"]
+HEADER = ["Название цветка", "Цвет", "Аромат", "Регионы распространения"]
+
+DISTRIBUTIONS = [
+    "random",
+    "sorted",
+    "reversed",
+    "organ_pipe",
+    "few_unique",
+    "nearly_sorted",
+    "quicksort_killer",
+]
+CHUNK_SIZE = 1 << 20
+
+# Все комбинации (название, цвет, аромат) в порядке сравнения Flower
+KEYS = [
+    (flower, color, aroma)
+    for flower in sorted(FLOWERS)
+    for color in sorted(COLORS)
+    for aroma in sorted(AROMAS)
+]
+
+
+def generate_chunks(
+    size,
+    distribution="random",
+    seed=None,
+    chunk_size=CHUNK_SIZE,
+    swaps=None,
+    unique=4,
+):
+    """
+    Yields the dataset as chunks of row ids.
+
+    A row id is ``key * len(REGIONS) + region``, where key indexes KEYS.
+
+    Args:
+        size (int): Total number of rows.
+        distribution (str): One of DISTRIBUTIONS.
+        seed (int): Seed of the generator.
+        chunk_size (int): Number of rows per chunk.
+        swaps (int): Swaps for nearly_sorted, 1% of the rows by default.
+        unique (int): Number of distinct flowers for few_unique.
+
+    Yields:
+        numpy.ndarray: Row ids of the next chunk.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    rng = np.random.default_rng(seed)
+    keys = _key_function(size, distribution, rng, swaps, unique)
 
+    for start in range(0, size, chunk_size):
+        positions = np.arange(start, min(start + chunk_size, size), dtype=np.int64)
+        if distribution == "quicksort_killer":
+            # Один регион: упакованные ключи FlowerTable упорядочены как Flower
+            regions = np.zeros(len(positions), dtype=np.int64)
+        else:
+            regions = rng.integers(0, len(REGIONS), len(positions))
+        yield keys(positions) * len(REGIONS) + regions
 
-def generate_plants_data(size):
-    flowers = ["Роза", "Тюльпан", "Пион", "Лилия", "Орхидея"]
-    colors = ["Красный", "Желтый", "Розовый", "Белый", "Фиолетовый"]
-    aromas = ["Сильный", "Умеренный", "Слабый"]
-    regions = ["Европа", "Азия", "Африка", "Америка", "Австралия"]
 
-    data = []
-    for _ in range(size):
-        flower = random.choice(flowers)
-        color = random.choice(colors)
-        aroma = random.choice(aromas)
-        region = random.choice(regions)
-        data.append([flower, color, aroma, region])
+def generate_plants_data(size, distribution="random", seed=None):
+    """
+    Returns the whole dataset as a list of rows.
 
-    return data
+    Args:
+        size (int): Number of rows.
+        distribution (str): One of DISTRIBUTIONS.
+        seed (int): Seed of the generator.
+
+    Returns:
+        list: Rows [flower, color, aroma, region].
+    """
+    rows = _rows()
+    return [
+        list(rows[i])
+        for chunk in generate_chunks(size, distribution, seed)
+        for i in chunk.tolist()
+    ]
 
 
 def write_to_csv(filename, data):
     with open(filename, "w", newline="") as file:
         writer = csv.writer(file)
-        writer.writerow(
-            ["Название цветка", "Цвет", "Аромат", "Регионы распространения"]
-        )
+        writer.writerow(HEADER)
         writer.writerows(data)
 
 
-data = generate_plants_data(100000)
-write_to_csv("plants.csv", data)
+def write_csv(filename, size, **options):
+    """
+    Streams a generated dataset into a CSV file.
+
+    Args:
+        filename (str): The output file.
+        size (int): Number of rows.
+        **options: Passed to generate_chunks.
+    """
+    lines = np.array([_csv_line(row) for row in _rows()], dtype=object)
+    with open(filename, "w", newline="") as file:
+        file.write(_csv_line(HEADER))
+        for chunk in generate_chunks(size, **options):
+            file.write("".join(lines[chunk].tolist()))
+
+
+def write_binary(filename, size, **options):
+    """
+    Streams a generated dataset into the binary format of data.cache.
+
+    The file can be loaded with ``data.cache.read_table``.
+
+    Args:
+        filename (str): The output file.
+        size (int): Number of rows.
+        **options: Passed to generate_chunks.
+    """
+    strings = sorted(set(FLOWERS + COLORS + AROMAS + REGIONS))
+    code = {s: i for i, s in enumerate(strings)}
+    bits = max(1, (len(strings) - 1).bit_length())
+
+    packed = np.zeros(len(KEYS) * len(REGIONS), dtype="<u8")
+    for i, row in enumerate(_rows()):
+        for value in row:
+            packed[i] = packed[i] << bits | code[value]
+
+    with open(filename, "wb") as file:
+        write_header(file, strings, size)
+        for chunk in generate_chunks(size, **options):
+            packed[chunk].tofile(file)
+
+
+def _rows():
+    return [key + (region,) for key in KEYS for region in REGIONS]
+
+
+def _csv_line(row):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()
+
+
+def _key_function(size, distribution, rng, swaps, unique):
+    # Возвращает функцию: номера строк -> номера ключей из KEYS
+    k = len(KEYS)
+
+    if distribution == "random":
+        return lambda positions: rng.integers(0, k, len(positions))
+
+    if distribution == "few_unique":
+        chosen = rng.choice(k, size=min(unique, k), replace=False)
+        return lambda positions: chosen[rng.integers(0, len(chosen), len(positions))]
+
+    if distribution == "quicksort_killer":
+        levels = _quicksort_killer(size, k)
+        return lambda positions: levels[positions]
+
+    ascending = _ascending(size, rng)
+    if distribution == "sorted":
+        return ascending
+    if distribution == "reversed":
+        return lambda positions: k - 1 - ascending(positions)
+
+    if distribution == "organ_pipe":
+        half = size // 2
+        first = _ascending(half, rng)
+        second = _ascending(size - half, rng)
+        return lambda positions: np.where(
+            positions < half,
+            first(np.minimum(positions, max(half - 1, 0))),
+            k - 1 - second(np.maximum(positions - half, 0)),
+        )
+
+    # nearly_sorted: перестановка небольшого числа позиций
+    if swaps is None:
+        swaps = size // 100
+    moved, sources = _swap_map(size, swaps, rng)
+
+    def nearly_sorted(positions):
+        source = positions.copy()
+        lo, hi = np.searchsorted(moved, [positions[0], positions[-1] + 1])
+        source[moved[lo:hi] - positions[0]] = sources[lo:hi]
+        return ascending(source)
+
+    return nearly_sorted
+
+
+def _ascending(size, rng):
+    # Случайное число строк на каждый ключ, ключи идут по возрастанию
+    bounds = np.cumsum(rng.multinomial(size, [1 / len(KEYS)] * len(KEYS)))
+    return lambda positions: np.searchsorted(bounds, positions, side="right")
+
+
+def _swap_map(size, swaps, rng):
+    permutation = {}
+    if size > 1:
+        pairs = rng.integers(0, size, (swaps, 2)).tolist()
+        for i, j in pairs:
+            permutation[i], permutation[j] = (
+                permutation.get(j, j),
+                permutation.get(i, i),
+            )
+    moved = np.array(sorted(permutation), dtype=np.int64)
+    sources = np.array([permutation[i] for i in moved.tolist()], dtype=np.int64)
+    return moved, sources
+
+
+def _quicksort_killer(size, k):
+    """
+    Assigns key ids so that quick_sort reaches its heap_sort fallback.
+
+    Musser's median-of-3 killer needs n distinct keys and does not defeat
+    the ninther of quick_sort, so the input is built against quick_sort
+    itself. Every partition round puts the lowest remaining key on two of
+    each three sampled slots, which makes the chosen pivot the minimum:
+    the round only removes those few rows, and after 2*log2(n) rounds the
+    depth limit hands the rest to heap_sort. The partition is replayed on
+    the slot order to know which rows the next round samples. A round uses
+    one key, so at most k - 1 rounds fit; with k = 75 that covers inputs up
+    to 2**37 rows. Unlike the other distributions this needs O(size) memory.
+
+    Returns:
+        numpy.ndarray: Key id of every row.
+    """
+    levels = np.full(size, k - 1, dtype=np.int64)
+    order = np.arange(size, dtype=np.int64)
+    lo, hi = 0, size
+    for level in range(min(2 * size.bit_length(), k - 1)):
+        if hi - lo <= INSERTION_THRESHOLD:
+            break
+        frozen = _pivot_samples(lo, hi)
+        levels[order[frozen]] = level
+        lo = _partition_min(order, lo, hi, [slot - lo for slot in frozen])
+    return levels
+
+
+def _pivot_samples(lo, hi):
+    # Первые два слота каждой тройки _choose_pivot
+    mid = (lo + hi) // 2
+    if hi - lo < NINTHER_THRESHOLD:
+        return [lo, mid]
+    step = (hi - lo) // 8
+    last = hi - 1
+    return [lo, lo + step, mid - step, mid, last - 2 * step, last - step]
+
+
+def _partition_min(order, lo, hi, equal):
+    # Повторяет _partition при опорном элементе, равном минимуму отрезка:
+    # строки equal уходят в начало, остальные сдвигаются кусками.
+    # Возвращает gt - начало части больше опорного
+    seg = order[lo:hi].copy()
+    out = order[lo:hi]
+    equal = sorted(equal)
+    is_equal = set(equal)
+    i, gt = 0, len(seg)
+    cur, cur_equal = seg[0], 0 in is_equal
+    while True:
+        if cur_equal:
+            out[i] = cur
+            i += 1
+            if i >= gt:
+                break
+            cur, cur_equal = seg[i], i in is_equal
+            continue
+        # Меньший элемент берется с конца, пройденные встают на gt - 1, gt - 2, ...
+        back = [q for q in equal if i < q < gt]
+        q = back[-1] if back else i
+        out[q:gt - 1] = seg[q + 1:gt]
+        out[gt - 1] = cur
+        if not back:
+            break
+        gt = q
+        cur, cur_equal = seg[q], True
+    return lo + i
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plants dataset generator")
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--output", default="data/plants.csv")
+    parser.add_argument("--format", choices=["csv", "bin"], default="csv")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--swaps", type=int, default=None, help="swaps for nearly_sorted")
+    parser.add_argument("--unique", type=int, default=4, help="distinct flowers for few_unique")
+    args = parser.parse_args()
+
+    write = write_csv if args.format == "csv" else write_binary
+    write(
+        args.output,
+        args.size,
+        distribution=args.distribution,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        swaps=args.swaps,
+        unique=args.unique,
+    )
+
+
+if __name__ == "__main__":
+    main()
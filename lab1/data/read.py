@@ -1,9 +1,25 @@
 import csv
 import random
 from .flower import Flower
+from .cache import load_table
+from .table import FlowerTable
 
+FIELDS = [
+    "Название цветка",
+    "Цвет",
+    "Аромат",
+    "Регионы распространения",
+]
+
+
+def read_plants_data(file_path, cache=True):
+    # Бинарный кэш рядом с CSV избавляет от повторного разбора
+    if cache:
+        try:
+            return read_plants_table(file_path).to_flowers()
+        except ValueError:
+            pass  # строк больше, чем помещается в упакованный ключ таблицы
 
-def read_plants_data(file_path):
     output = []
     with open(file_path, "r") as csv_file:
         reader = csv.DictReader(csv_file)
@@ -19,6 +35,20 @@ def read_plants_data(file_path):
     return output
 
 
+def read_plants_table(file_path, cache=True):
+    if cache:
+        return load_table(file_path, _parse_table)
+    return _parse_table(file_path)
+
+
+def _parse_table(file_path):
+    with open(file_path, "r") as csv_file:
+        reader = csv.DictReader(csv_file)
+        return FlowerTable.from_rows(
+            [row[field] for field in FIELDS] for row in reader
+        )
+
+
 def select_random_subset(arr, length):
     if length > len(arr):
         raise ValueError(
@@ -26,4 +56,7 @@ def select_random_subset(arr, length):
         )
 
     random.shuffle(arr)  # перемешиваем массив в случайном порядке
-    return arr[:length]  # выбираем первые length элементов
+    subset = arr[:length]  # выбираем первые length элементов
+    if isinstance(arr, FlowerTable):
+        return arr.take(subset)
+    return subset
@@ -0,0 +1,209 @@
+"""
+Columnar, dictionary-encoded storage for the plants dataset.
+
+A FlowerTable is an ``array('Q')`` of packed row keys. Every string of the
+dataset is stored once in a sorted shared dictionary, and each row is packed
+into a single integer of four dictionary codes:
+
+    name | color | aroma | regions
+
+Because the dictionary is sorted, comparing two packed keys gives the same
+order as comparing the corresponding Flower objects (with the region as a
+last tie-breaker), so every comparison made by the sorts in ``sorts`` is a
+single int compare. The sorts accept the table directly: indexing, swaps and
+``len`` go straight to the underlying C array. Four codes share the 64 bits
+of a key, so a table holds at most 65536 distinct strings; beyond that the
+constructor raises ValueError and ``read_plants_data`` parses the CSV into
+Flower objects instead.
+
+Example usage:
+    >>> table = FlowerTable.from_rows([
+    ...     ["Роза", "Белый", "Слабый", "Азия"],
+    ...     ["Пион", "Красный", "Сильный", "Европа"],
+    ... ])
+    >>> heap_sort(table)
+    >>> list(table.values("name"))
+    ['Пион', 'Роза']
+"""
+
+from array import array
+
+from .flower import Flower
+
+
+class FlowerTable(array):
+    """
+    Packed row keys plus the shared string dictionary they refer to.
+
+    Attributes:
+        strings (list): Sorted list of every distinct string in the table.
+        bits (int): Width of one field code inside a packed key.
+    """
+
+    FIELDS = ("name", "color", "aroma", "regions")
+
+    def __new__(cls, strings=(), keys=()):
+        self = super().__new__(cls, "Q", keys)
+        self.strings = list(strings)
+        self.lookup = {s: code for code, s in enumerate(self.strings)}
+        self.bits = max(1, (len(self.strings) - 1).bit_length())
+        if self.bits * len(cls.FIELDS) > 64:
+            raise ValueError("Too many distinct strings to pack a row key")
+        self.mask = (1 << self.bits) - 1
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (self.strings, self.tolist())
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds a table from rows of (name, color, aroma, regions) strings.
+
+        Args:
+            rows (iterable): Rows with four string fields each.
+
+        Returns:
+            FlowerTable: The encoded table.
+        """
+        rows = [tuple(row) for row in rows]
+        strings = sorted({value for row in rows for value in row})
+        table = cls(strings)
+        encode = table.encode
+        table.extend(encode(*row) for row in rows)
+        return table
+
+    @classmethod
+    def from_flowers(cls, flowers):
+        """
+        Builds a table from a list of Flower objects.
+
+        Args:
+            flowers (list): The flowers to encode.
+
+        Returns:
+            FlowerTable: The encoded table.
+        """
+        return cls.from_rows(
+            (f.name, f.color, f.aroma, f.regions) for f in flowers
+        )
+
+    def take(self, keys):
+        """
+        Returns a new table with the given packed keys and this dictionary.
+
+        Args:
+            keys (iterable): Packed keys produced by this table.
+
+        Returns:
+            FlowerTable: The new table.
+        """
+        return self.__class__(self.strings, keys)
+
+    def copy(self):
+        """Returns an independent copy that shares the string dictionary."""
+        return self.take(self)
+
+    def encode(self, name, color, aroma, regions):
+        """
+        Packs one row into an integer key.
+
+        Returns:
+            int: The packed key.
+        """
+        lookup = self.lookup
+        bits = self.bits
+        return (
+            (
+                (lookup[name] << bits | lookup[color]) << bits
+                | lookup[aroma]
+            ) << bits
+        ) | lookup[regions]
+
+    def codes(self, key):
+        """
+        Unpacks a key into its four dictionary codes.
+
+        Args:
+            key (int): The packed key.
+
+        Returns:
+            tuple: (name, color, aroma, regions) codes.
+        """
+        bits = self.bits
+        mask = self.mask
+        return (
+            key >> 3 * bits,
+            key >> 2 * bits & mask,
+            key >> bits & mask,
+            key & mask,
+        )
+
+    def decode(self, key):
+        """
+        Unpacks a key into its four strings.
+
+        Args:
+            key (int): The packed key.
+
+        Returns:
+            tuple: (name, color, aroma, regions) strings.
+        """
+        strings = self.strings
+        return tuple(strings[code] for code in self.codes(key))
+
+    def sort_key(self, key):
+        """
+        Drops the region from a packed key, leaving the Flower ordering.
+
+        Args:
+            key (int): The packed key.
+
+        Returns:
+            int: The (name, color, aroma) part of the key.
+        """
+        return key >> self.bits
+
+    def column(self, field):
+        """
+        Decodes one field into a column of small-int dictionary codes.
+
+        Args:
+            field (str): One of FIELDS.
+
+        Returns:
+            array: The codes of the field, one per row.
+        """
+        shift = (len(self.FIELDS) - 1 - self.FIELDS.index(field)) * self.bits
+        mask = self.mask
+        return array("H", (key >> shift & mask for key in self))
+
+    def values(self, field):
+        """
+        Iterates over the strings of one field.
+
+        Args:
+            field (str): One of FIELDS.
+        """
+        strings = self.strings
+        return (strings[code] for code in self.column(field))
+
+    def flower(self, i):
+        """
+        Materializes row i as a Flower.
+
+        Args:
+            i (int): The row index.
+
+        Returns:
+            Flower: The decoded row.
+        """
+        return Flower(*self.decode(self[i]))
+
+    def to_flowers(self):
+        """Materializes the whole table as a list of Flower objects."""
+        return [Flower(*self.decode(key)) for key in self]
+
+    def to_rows(self):
+        """Materializes the whole table as a list of string rows."""
+        return [list(self.decode(key)) for key in self]
@@ -1,4 +1,3 @@
-import time
 import matplotlib.pyplot as plt
 
 from loguru import logger
@@ -6,50 +5,70 @@ from loguru import logger
 from sorts.heap import heap_sort
 from sorts.quicksort import quick_sort
 from sorts.selection import selection_sort
+from sorts.radix import radix_sort, is_low_cardinality
+from sorts.numpy_sort import numpy_sort
+from sorts.merge import merge_sort
 
-from data.read import read_plants_data, select_random_subset
+from data.read import read_plants_table
 
+from benchmark import MAX_LENGTHS, make_input, summarize, time_sort
 
+# Квадратичная сортировка на больших входах запускается один раз, без прогрева
+SINGLE_RUN_LENGTHS = {selection_sort: MAX_LENGTHS["selection_sort"]}
+
+
+# Каждая сортировка получает свою копию входа
 def measure_sorting_time(sort_func, data):
-    start_time = time.time()
-    sort_func(data)
-    end_time = time.time()
-    return end_time - start_time
+    if len(data) > SINGLE_RUN_LENGTHS.get(sort_func, len(data)):
+        times = time_sort(sort_func, data, repeats=1, warmup=0)
+    else:
+        times = time_sort(sort_func, data)
+    return summarize(times)
+
+
+def record_time(times, label, sort_func, data):
+    stats = measure_sorting_time(sort_func, data)
+    times.append(stats["median_ns"] / 1e9)
+    logger.info(
+        f'{label} Time: median {stats["median_ns"] / 1e9} seconds, '
+        f'p95 {stats["p95_ns"] / 1e9} seconds'
+    )
 
 
 logger.add('times.log')
-all_data = read_plants_data('data/plants.csv')
+all_data = read_plants_table('data/plants.csv')
 data_lengths = [1000, 5000, 10000, 15000, 20000, 25000, 50000, 75000, 100000]
 data_sets = []
 for length in data_lengths:
-    data_sets.append(select_random_subset(all_data, length))
+    data_sets.append(make_input(all_data, length, "random", seed=length))
 
 quicksort_times = []
 heapsort_times = []
 selectionsort_times = []
+radixsort_times = []
+numpysort_times = []
+mergesort_times = []
+use_radix = is_low_cardinality(all_data)
 
 for data in data_sets:
     logger.info(f'Data length: {len(data)}')
-    quicksort_times.append(measure_sorting_time(quick_sort, data))
-
-    qs_time = quicksort_times[-1]
-    logger.info(f'QS Time: {qs_time} seconds')
-
-    heapsort_times.append(measure_sorting_time(heap_sort, data))
-
-    heapsort_time = heapsort_times[-1]
-    logger.info(f'HS Time: {heapsort_time} seconds')
-
-    selectionsort_times.append(measure_sorting_time(selection_sort, data))
-
-    selectionsort_time = selectionsort_times[-1]
-    logger.info(f'SS Time: {selectionsort_time} seconds')
+    record_time(quicksort_times, 'QS', quick_sort, data)
+    record_time(heapsort_times, 'HS', heap_sort, data)
+    record_time(selectionsort_times, 'SS', selection_sort, data)
+    record_time(numpysort_times, 'NS', numpy_sort, data)
+    record_time(mergesort_times, 'MS', merge_sort, data)
+    if use_radix:
+        record_time(radixsort_times, 'RS', radix_sort, data)
 
 plt.plot(data_lengths, quicksort_times, label="Quicksort")
 plt.plot(data_lengths, heapsort_times, label="Heapsort")
 plt.plot(data_lengths, selectionsort_times, label="Selectionsort")
+plt.plot(data_lengths, numpysort_times, label="NumPy sort")
+plt.plot(data_lengths, mergesort_times, label="Mergesort")
+if use_radix:
+    plt.plot(data_lengths, radixsort_times, label="Radixsort")
 plt.xlabel("Data Length")
-plt.ylabel("Time (seconds)")
+plt.ylabel("Median time (seconds)")
 plt.title("Sorting Algorithms Comparison")
 plt.legend()
 plt.savefig('plot.png')
@@ -0,0 +1,187 @@
+"""
+This module contains an external merge sort for plants CSV files.
+
+The CSV is read in chunks that fit into a memory budget, every chunk is
+sorted with quick_sort and spilled to a temporary file as a sorted run, and
+the runs are combined with a k-way heap merge. When there are more runs than
+the fan-in allows, they are merged in several passes. Only one chunk and one
+row per merged run are kept in memory at a time.
+
+Functions:
+    - iter_sorted(input_path, ...): Yields the rows of a CSV in sorted order.
+    - external_sort(input_path, output_path, ...): Writes a sorted CSV.
+
+Example usage:
+    $ python -m sorts.external data/plants.csv data/plants_sorted.csv --memory 16
+"""
+
+import argparse
+import csv
+import heapq
+import os
+import sys
+import tempfile
+from operator import itemgetter
+
+from .quicksort import quick_sort
+
+# Бюджет памяти по умолчанию - 64 МБ
+MEMORY_BUDGET = 64 * 1024 * 1024
+FAN_IN = 16
+# Название цветка, цвет, аромат
+KEY_COLUMNS = (0, 1, 2)
+
+
+def iter_sorted(
+    input_path,
+    memory_budget=MEMORY_BUDGET,
+    fan_in=FAN_IN,
+    key_columns=KEY_COLUMNS,
+    tmp_dir=None,
+    encoding=None,
+):
+    """
+    Yields the data rows of a CSV file in sorted order.
+
+    Args:
+        input_path (str): The CSV file with a header row.
+        memory_budget (int): Approximate number of bytes of rows kept in
+            memory while sorting a chunk.
+        fan_in (int): Maximum number of runs merged at once.
+        key_columns (tuple): Indexes of the columns to sort by.
+        tmp_dir (str): Directory for the sorted runs.
+        encoding (str): Encoding of the CSV file.
+
+    Yields:
+        list: The rows, without the header.
+    """
+    with open(input_path, "r", newline="", encoding=encoding) as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader, None)
+        yield from _sort_rows(
+            reader, memory_budget, fan_in, itemgetter(*key_columns), tmp_dir
+        )
+
+
+def external_sort(
+    input_path,
+    output_path,
+    memory_budget=MEMORY_BUDGET,
+    fan_in=FAN_IN,
+    key_columns=KEY_COLUMNS,
+    tmp_dir=None,
+    encoding=None,
+):
+    """
+    Sorts a CSV file that may not fit into memory into another CSV file.
+
+    Args:
+        input_path (str): The CSV file with a header row.
+        output_path (str): The sorted CSV file. The header is copied.
+        memory_budget (int): See iter_sorted.
+        fan_in (int): See iter_sorted.
+        key_columns (tuple): See iter_sorted.
+        tmp_dir (str): See iter_sorted.
+        encoding (str): Encoding of both files.
+
+    Returns:
+        int: Number of sorted rows.
+    """
+    count = 0
+    with open(input_path, "r", newline="", encoding=encoding) as csv_file, \
+            open(output_path, "w", newline="", encoding=encoding) as out_file:
+        reader = csv.reader(csv_file)
+        writer = csv.writer(out_file)
+        header = next(reader, None)
+        if header is not None:
+            writer.writerow(header)
+        for row in _sort_rows(
+            reader, memory_budget, fan_in, itemgetter(*key_columns), tmp_dir
+        ):
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _sort_rows(reader, memory_budget, fan_in, key, tmp_dir):
+    if fan_in < 2:
+        raise ValueError("Fan-in must be at least 2")
+
+    chunks = _read_chunks(reader, memory_budget)
+    first = next(chunks, [])
+    second = next(chunks, None)
+
+    # Все данные поместились в память - временные файлы не нужны
+    if second is None:
+        yield from quick_sort(first, key=key)
+        return
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        runs = [_write_run(tmp, first, key), _write_run(tmp, second, key)]
+        del first, second
+        runs.extend(_write_run(tmp, chunk, key) for chunk in chunks)
+
+        while len(runs) > fan_in:
+            runs = [
+                _merge_runs(tmp, runs[i:i + fan_in], key)
+                for i in range(0, len(runs), fan_in)
+            ]
+
+        yield from heapq.merge(*map(_read_run, runs), key=key)
+
+
+def _read_chunks(reader, memory_budget):
+    chunk = []
+    size = 0
+    for row in reader:
+        chunk.append(row)
+        size += sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+        if size >= memory_budget:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def _write_run(tmp, rows, key):
+    quick_sort(rows, key=key)
+    return _spill(tmp, rows)
+
+
+def _merge_runs(tmp, runs, key):
+    path = _spill(tmp, heapq.merge(*map(_read_run, runs), key=key))
+    for run in runs:
+        os.remove(run)
+    return path
+
+
+def _spill(tmp, rows):
+    fd, path = tempfile.mkstemp(dir=tmp, suffix=".csv")
+    with open(fd, "w", newline="", encoding="utf-8") as run_file:
+        csv.writer(run_file).writerows(rows)
+    return path
+
+
+def _read_run(path):
+    with open(path, "r", newline="", encoding="utf-8") as run_file:
+        yield from csv.reader(run_file)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="External sort of a plants CSV")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--memory", type=int, default=64, help="memory budget, MB")
+    parser.add_argument("--fan-in", type=int, default=FAN_IN)
+    parser.add_argument("--tmp-dir", default=None)
+    args = parser.parse_args()
+
+    rows = external_sort(
+        args.input,
+        args.output,
+        memory_budget=args.memory * 1024 * 1024,
+        fan_in=args.fan_in,
+        tmp_dir=args.tmp_dir,
+    )
+    print(f"Sorted {rows} rows")
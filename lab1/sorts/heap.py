@@ -1,54 +1,318 @@
 """
 This module contains functions for performing heap sort on an array.
 
+All heaps are d-ary (binary by default) and every sift is iterative and
+uses Floyd's bottom-up strategy: the hole left by the root is moved down to
+a leaf along the path of the best children (d - 1 comparisons per level,
+no swaps), and only then is the displaced element sifted back up, which in
+practice takes one or two comparisons.
+
 Functions:
-    - heapify(arr, n, i): Rearranges the subarray arr[i:] into a heap structure
-    - heap_sort(arr): Sorts the given array using heap sort algorithm.
+    - heapify(arr, n, i, d): Sifts arr[i] down the max-heap arr[:n].
+    - heap_sort(arr, d): Sorts the given array using heap sort algorithm.
+    - partial_sort(arr, k, d): Puts the k smallest elements sorted in arr[:k].
+    - nsmallest(n, iterable, key, d): Returns the n smallest elements.
+    - nlargest(n, iterable, key, d): Returns the n largest elements.
+
+Classes:
+    - Heap: A d-ary min-heap with push/pop/replace.
 
 Example usage:
     >>> arr = [4, 10, 3, 5, 1]
     >>> heap_sort(arr)
     >>> print(arr)
     [1, 3, 4, 5, 10]
+    >>> nsmallest(2, [4, 10, 3, 5, 1])
+    [1, 3]
 """
 
 
-def heapify(arr, n, i):
+def heapify(arr, n, i, d=2):
     """
     Rearranges the subarray arr[i:] into a heap structure.
 
+    Sifts arr[i] down the max-heap arr[:n] whose children are already heaps.
+
     Args:
         arr (list): The input array.
         n (int): The size of the array.
         i (int): The index to start heapifying from.
+        d (int): The arity of the heap.
     """
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-
-    if left < n and arr[i] < arr[left]:
-        largest = left
+    item = arr[i]
+    start = i
 
-    if right < n and arr[largest] < arr[right]:
-        largest = right
+    # Дыра опускается до листа по пути наибольших потомков
+    if d == 2:
+        # Двоичная куча: два потомка сравниваются напрямую, без range
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and arr[child] < arr[right]:
+                child = right
+            arr[i] = arr[child]
+            i = child
+            child = 2 * i + 1
+    else:
+        child = d * i + 1
+        while child < n:
+            best = child
+            last = child + d
+            if last > n:
+                last = n
+            for c in range(child + 1, last):
+                if arr[best] < arr[c]:
+                    best = c
+            arr[i] = arr[best]
+            i = best
+            child = d * i + 1
 
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+    # Элемент поднимается от листа на свое место
+    while i > start:
+        parent = (i - 1) // d
+        if not arr[parent] < item:
+            break
+        arr[i] = arr[parent]
+        i = parent
+    arr[i] = item
 
 
-def heap_sort(arr):
+def heap_sort(arr, d=2):
     """
     Sorts the given array using heap sort algorithm.
 
     Args:
         arr (list): The array to be sorted.
+        d (int): The arity of the heap.
+    """
+    n = len(arr)
+    _build_max_heap(arr, n, d)
+    _sort_max_heap(arr, n, d)
+
+
+def partial_sort(arr, k, d=2):
+    """
+    Rearranges the array so that arr[:k] holds its k smallest elements.
+
+    The prefix is sorted, the order of the rest is unspecified. Takes
+    O(n log k) comparisons instead of O(n log n) for a full sort.
+
+    Args:
+        arr (list): The array to be rearranged.
+        k (int): The size of the sorted prefix.
+        d (int): The arity of the heap.
     """
     n = len(arr)
+    k = max(0, min(k, n))
+    if k == 0:
+        return
+
+    _build_max_heap(arr, k, d)
+    for i in range(k, n):
+        if arr[i] < arr[0]:
+            arr[i], arr[0] = arr[0], arr[i]
+            heapify(arr, k, 0, d)
+    _sort_max_heap(arr, k, d)
+
+
+def nsmallest(n, iterable, key=None, d=2):
+    """
+    Returns the n smallest elements of the iterable, sorted.
+
+    Keeps a bounded max-heap of n candidates, so only O(n) elements are held
+    in memory and the input is scanned once. Equal elements keep their
+    order.
+
+    Args:
+        n (int): Number of elements to return.
+        iterable (iterable): The input.
+        key (callable): Function computing the comparison key.
+        d (int): The arity of the heap.
+
+    Returns:
+        list: The n smallest elements in ascending order.
+    """
+    if n <= 0:
+        return []
+
+    # Порядковый номер разрешает равенство ключей и сохраняет порядок
+    entries = ((x if key is None else key(x), i, x) for i, x in enumerate(iterable))
+    heap = []
+    for entry in entries:
+        heap.append(entry)
+        if len(heap) == n:
+            break
+    _build_max_heap(heap, len(heap), d)
+
+    for entry in entries:
+        if entry < heap[0]:
+            heap[0] = entry
+            heapify(heap, n, 0, d)
+
+    _sort_max_heap(heap, len(heap), d)
+    return [x for _, _, x in heap]
+
+
+def nlargest(n, iterable, key=None, d=2):
+    """
+    Returns the n largest elements of the iterable, sorted.
+
+    Args:
+        n (int): Number of elements to return.
+        iterable (iterable): The input.
+        key (callable): Function computing the comparison key.
+        d (int): The arity of the heap.
+
+    Returns:
+        list: The n largest elements in descending order.
+    """
+    if n <= 0:
+        return []
+
+    entries = (
+        (x if key is None else key(x), -i, x) for i, x in enumerate(iterable)
+    )
+    heap = Heap(d=d)
+    for entry in entries:
+        heap.push(entry)
+        if len(heap) == n:
+            break
+
+    for entry in entries:
+        if heap.peek() < entry:
+            heap.replace(entry)
+
+    result = []
+    while heap:
+        result.append(heap.pop()[2])
+    result.reverse()
+    return result
+
+
+class Heap:
+    """
+    A d-ary min-heap.
+
+    Example usage:
+        >>> heap = Heap([5, 1, 4])
+        >>> heap.push(2)
+        >>> heap.pop()
+        1
+        >>> heap.replace(3)
+        2
+    """
+
+    def __init__(self, items=(), d=2, key=None):
+        """
+        Args:
+            items (iterable): Initial elements.
+            d (int): The arity of the heap.
+            key (callable): Function computing the comparison key.
+        """
+        if d < 2:
+            raise ValueError("Heap arity must be at least 2")
+        self.d = d
+        self.key = key
+        self._count = 0
+        self._heap = [self._entry(x) for x in items]
+        n = len(self._heap)
+        for i in range((n - 2) // d, -1, -1):
+            self._sift_down(i)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, item):
+        """Adds an element to the heap."""
+        self._heap.append(self._entry(item))
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self):
+        """Returns the smallest element without removing it."""
+        if not self._heap:
+            raise IndexError("peek from an empty heap")
+        return self._item(self._heap[0])
+
+    def pop(self):
+        """Removes and returns the smallest element."""
+        if not self._heap:
+            raise IndexError("pop from an empty heap")
+        last = self._heap.pop()
+        if not self._heap:
+            return self._item(last)
+        top = self._heap[0]
+        self._heap[0] = last
+        self._sift_down(0)
+        return self._item(top)
+
+    def replace(self, item):
+        """Pops the smallest element and pushes a new one in a single sift."""
+        if not self._heap:
+            raise IndexError("replace on an empty heap")
+        top = self._heap[0]
+        self._heap[0] = self._entry(item)
+        self._sift_down(0)
+        return self._item(top)
+
+    def pushpop(self, item):
+        """Pushes an element, then pops and returns the smallest one."""
+        entry = self._entry(item)
+        if self._heap and self._heap[0] < entry:
+            entry, self._heap[0] = self._heap[0], entry
+            self._sift_down(0)
+        return self._item(entry)
+
+    def _entry(self, item):
+        if self.key is None:
+            return item
+        self._count += 1
+        return (self.key(item), self._count, item)
+
+    def _item(self, entry):
+        return entry if self.key is None else entry[2]
+
+    def _sift_down(self, i):
+        heap = self._heap
+        d = self.d
+        n = len(heap)
+        item = heap[i]
+        start = i
+
+        child = d * i + 1
+        while child < n:
+            best = child
+            last = child + d
+            if last > n:
+                last = n
+            for c in range(child + 1, last):
+                if heap[c] < heap[best]:
+                    best = c
+            heap[i] = heap[best]
+            i = best
+            child = d * i + 1
+
+        heap[i] = item
+        self._sift_up(i, start)
+
+    def _sift_up(self, i, start=0):
+        heap = self._heap
+        d = self.d
+        item = heap[i]
+        while i > start:
+            parent = (i - 1) // d
+            if not item < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            i = parent
+        heap[i] = item
+
+
+def _build_max_heap(arr, n, d):
+    for i in range((n - 2) // d, -1, -1):
+        heapify(arr, n, i, d)
 
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
 
+def _sort_max_heap(arr, n, d):
     for i in range(n - 1, 0, -1):
         arr[i], arr[0] = arr[0], arr[i]
-        heapify(arr, i, 0)
+        heapify(arr, i, 0, d)
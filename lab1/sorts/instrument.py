@@ -0,0 +1,261 @@
+"""
+This module contains opt-in cost instrumentation for the sorts.
+
+measure_costs runs a sort once on an instrumented copy of its input and
+counts what the algorithm actually does:
+
+    - comparisons, per operator (``<``, ``>``, ``==``, ...), made between
+      elements. Flowers are counted at the Flower level, so the __lt__ and
+      __eq__ calls that Flower.__le__ / __ge__ make inside are counted too;
+    - writes into the array and how many of them form swaps, including
+      writes into slices and copies taken from it (e.g. the heap fallback
+      of quick_sort);
+    - calls of functions from this package and the maximum nesting depth;
+    - peak memory allocated during the sort (tracemalloc).
+
+Nothing is patched globally: the sorts only see counting wrappers while
+measure_costs runs, so ordinary runs have no overhead at all.
+
+Not counted: comparisons between keys computed by a ``key=`` function
+(they are plain values, not elements) and writes into helper lists that
+are not taken from the array, such as the buckets of radix_sort.
+
+Functions:
+    - measure_costs(sort_func, data, memory, calls): Returns the counters.
+
+Example usage:
+    >>> measure_costs(heap_sort, [4, 10, 3, 5, 1])["writes"]
+    23
+"""
+
+import os
+import sys
+import tracemalloc
+
+from data.flower import Flower
+
+SORTS_DIR = os.path.dirname(os.path.abspath(__file__))
+OPERATORS = ("lt", "gt", "le", "ge", "eq", "ne")
+
+
+class CountingList(list):
+    """
+    A list that counts element writes and recognizes swaps.
+
+    Two consecutive writes that exchange two elements, as in
+    ``arr[i], arr[j] = arr[j], arr[i]``, are counted as one swap. Slices
+    and copies are CountingLists sharing the counters, so writes into a
+    block taken from the array are counted as well.
+    """
+
+    def __init__(self, items=(), stats=None):
+        super().__init__(items)
+        # Счетчики общие для списка, его срезов и копий
+        self.stats = stats if stats is not None else {"writes": 0, "swaps": 0}
+        self._last = None
+
+    @property
+    def writes(self):
+        return self.stats["writes"]
+
+    @property
+    def swaps(self):
+        return self.stats["swaps"]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountingList(super().__getitem__(index), self.stats)
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        stats = self.stats
+        if isinstance(index, slice):
+            value = list(value)
+            stats["writes"] += len(value)
+            self._last = None
+            super().__setitem__(index, value)
+            return
+
+        old = list.__getitem__(self, index)
+        stats["writes"] += 1
+        last = self._last
+        if last is not None and value is last[0] and last[1] is old:
+            stats["swaps"] += 1
+            self._last = None
+        else:
+            self._last = (old, value)
+        super().__setitem__(index, value)
+
+    def copy(self):
+        return CountingList(self, self.stats)
+
+
+class Counted:
+    """
+    Wraps an element and counts the comparisons made with it.
+
+    Attribute access is forwarded to the wrapped element, so field-based
+    sorts (radix_sort, numpy_sort) keep working.
+    """
+
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value, counts):
+        self.value = value
+        self.counts = counts
+
+    def __getattr__(self, name):
+        if name in Counted.__slots__:
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __lt__(self, other):
+        self.counts["lt"] += 1
+        return self.value < _unwrap(other)
+
+    def __gt__(self, other):
+        self.counts["gt"] += 1
+        return self.value > _unwrap(other)
+
+    def __le__(self, other):
+        self.counts["le"] += 1
+        return self.value <= _unwrap(other)
+
+    def __ge__(self, other):
+        self.counts["ge"] += 1
+        return self.value >= _unwrap(other)
+
+    def __eq__(self, other):
+        self.counts["eq"] += 1
+        return self.value == _unwrap(other)
+
+    def __ne__(self, other):
+        self.counts["ne"] += 1
+        return self.value != _unwrap(other)
+
+
+class CountedFlower(Flower):
+    """
+    A Flower that counts its comparisons.
+
+    Every operator is counted and then runs the Flower method on this
+    object, so the nested self.__lt__ / self.__eq__ calls of
+    Flower.__le__ / __ge__ come back here and are counted as well.
+    """
+
+    def __init__(self, flower, counts):
+        super().__init__(flower.name, flower.color, flower.aroma, flower.regions)
+        self.counts = counts
+
+    def __lt__(self, other):
+        self.counts["lt"] += 1
+        return Flower.__lt__(self, other)
+
+    def __gt__(self, other):
+        self.counts["gt"] += 1
+        return Flower.__gt__(self, other)
+
+    def __le__(self, other):
+        self.counts["le"] += 1
+        return Flower.__le__(self, other)
+
+    def __ge__(self, other):
+        self.counts["ge"] += 1
+        return Flower.__ge__(self, other)
+
+    def __eq__(self, other):
+        self.counts["eq"] += 1
+        return Flower.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.counts["ne"] += 1
+        return not Flower.__eq__(self, other)
+
+
+def measure_costs(sort_func, data, memory=True, calls=True):
+    """
+    Runs the sort once on an instrumented copy of the data.
+
+    A FlowerTable is decoded to Flower objects first, so the counted
+    comparisons are Flower comparisons.
+
+    Args:
+        sort_func (callable): The in-place sort.
+        data (list): The input. It is never modified.
+        memory (bool): Whether to trace the peak memory.
+        calls (bool): Whether to count calls and the nesting depth.
+
+    Returns:
+        dict: comparisons, writes, swaps, calls, max_depth and
+            peak_memory_bytes (None for the disabled parts).
+    """
+    if hasattr(data, "to_flowers"):
+        data = data.to_flowers()
+    counts = dict.fromkeys(OPERATORS, 0)
+    arr = CountingList(_wrap(x, counts) for x in data)
+
+    profiler = _CallProfiler() if calls else None
+    started = False
+    if memory:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    if profiler is not None:
+        sys.setprofile(profiler)
+    try:
+        sort_func(arr)
+    finally:
+        if profiler is not None:
+            sys.setprofile(None)
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            if started:
+                tracemalloc.stop()
+
+    return {
+        "comparisons": {**counts, "total": sum(counts.values())},
+        "writes": arr.writes,
+        "swaps": arr.swaps,
+        "calls": profiler.calls if calls else None,
+        "max_depth": profiler.max_depth if calls else None,
+        "peak_memory_bytes": max(0, peak) if memory else None,
+    }
+
+
+class _CallProfiler:
+    # Считает вызовы функций из пакета sorts и глубину их вложенности
+    def __init__(self):
+        self.calls = {}
+        self.depth = 0
+        self.max_depth = 0
+
+    def __call__(self, frame, event, arg):
+        if event not in ("call", "return"):
+            return
+        code = frame.f_code
+        if os.path.dirname(code.co_filename) != SORTS_DIR:
+            return
+        if code.co_filename == __file__:
+            return
+        if event == "call":
+            self.calls[code.co_name] = self.calls.get(code.co_name, 0) + 1
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+        else:
+            self.depth -= 1
+
+
+def _wrap(x, counts):
+    if isinstance(x, Flower):
+        return CountedFlower(x, counts)
+    return Counted(x, counts)
+
+
+def _unwrap(other):
+    return other.value if type(other) is Counted else other
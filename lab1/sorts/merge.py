@@ -0,0 +1,256 @@
+"""
+This module contains an adaptive natural merge sort in the style of TimSort.
+
+The array is split into natural runs: ascending runs are kept as they are
+and strictly descending runs are reversed in place. Runs shorter than
+minrun are extended with binary insertion sort, and the runs are merged
+following the TimSort stack invariants, so presorted input takes O(n)
+comparisons. Merges copy only the smaller run into a temporary buffer and
+switch to galloping (exponential search) when one run keeps winning.
+
+The sort is stable.
+
+Functions:
+    - merge_sort(arr): Sorts the given array in place.
+
+Example usage:
+    >>> arr = [4, 10, 3, 5, 1]
+    >>> merge_sort(arr)
+    >>> print(arr)
+    [1, 3, 4, 5, 10]
+"""
+
+from bisect import bisect_left, bisect_right
+
+MIN_MERGE = 64
+MIN_GALLOP = 7
+
+
+def merge_sort(arr):
+    """
+    Sorts the given array in place using natural merge sort.
+
+    Args:
+        arr (list): The array to be sorted.
+
+    Returns:
+        list: The same array, sorted.
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    minrun = _min_run(n)
+    runs = []  # стек пар [начало, длина]
+    lo = 0
+    while lo < n:
+        run = _count_run(arr, lo, n)
+        if run < minrun:
+            forced = min(minrun, n - lo)
+            _binary_insertion_sort(arr, lo, lo + forced, lo + run)
+            run = forced
+        runs.append([lo, run])
+        _merge_collapse(arr, runs)
+        lo += run
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(arr, runs, i)
+    return arr
+
+
+def _min_run(n):
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(arr, lo, hi):
+    i = lo + 1
+    if i == hi:
+        return 1
+
+    if arr[i] < arr[lo]:
+        # Только строго убывающие серии можно развернуть без потери устойчивости
+        i += 1
+        while i < hi and arr[i] < arr[i - 1]:
+            i += 1
+        arr[lo:i] = arr[lo:i][::-1]
+    else:
+        i += 1
+        while i < hi and not arr[i] < arr[i - 1]:
+            i += 1
+    return i - lo
+
+
+def _binary_insertion_sort(arr, lo, hi, start):
+    # arr[lo:start] уже отсортирован
+    for i in range(start, hi):
+        pivot = arr[i]
+        pos = bisect_right(arr, pivot, lo, i)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = pivot
+
+
+def _merge_collapse(arr, runs):
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or (
+            i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]
+        ):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _merge_at(arr, runs, i)
+
+
+def _merge_at(arr, runs, i):
+    a, len_a = runs[i]
+    b, len_b = runs[i + 1]
+    runs[i][1] = len_a + len_b
+    del runs[i + 1]
+
+    # Начало A, не превосходящее arr[b], уже на своем месте
+    k = _gallop(arr[b], arr, a, a + len_a, right=True, from_end=False) - a
+    a += k
+    len_a -= k
+    if len_a == 0:
+        return
+    # Конец B, не меньший последнего элемента A, тоже на месте
+    len_b = _gallop(arr[a + len_a - 1], arr, b, b + len_b, right=False, from_end=True) - b
+    if len_b == 0:
+        return
+
+    if len_a <= len_b:
+        _merge_lo(arr, a, len_a, b, len_b)
+    else:
+        _merge_hi(arr, a, len_a, b, len_b)
+
+
+def _merge_lo(arr, a, len_a, b, len_b):
+    tmp = arr[a:a + len_a]
+    i, j, dest = 0, b, a
+    b_end = b + len_b
+    min_gallop = MIN_GALLOP
+
+    while i < len_a and j < b_end:
+        count_a = count_b = 0
+        while i < len_a and j < b_end:
+            if arr[j] < tmp[i]:
+                arr[dest] = arr[j]
+                j += 1
+                count_b += 1
+                count_a = 0
+            else:
+                arr[dest] = tmp[i]
+                i += 1
+                count_a += 1
+                count_b = 0
+            dest += 1
+            if count_a >= min_gallop or count_b >= min_gallop:
+                break
+
+        while i < len_a and j < b_end:
+            k = _gallop(arr[j], tmp, i, len_a, right=True, from_end=False) - i
+            arr[dest:dest + k] = tmp[i:i + k]
+            dest += k
+            i += k
+            if i == len_a:
+                break
+
+            k2 = _gallop(tmp[i], arr, j, b_end, right=False, from_end=False) - j
+            arr[dest:dest + k2] = arr[j:j + k2]
+            dest += k2
+            j += k2
+
+            if k < MIN_GALLOP and k2 < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    if i < len_a:
+        arr[dest:dest + len_a - i] = tmp[i:len_a]
+
+
+def _merge_hi(arr, a, len_a, b, len_b):
+    tmp = arr[b:b + len_b]
+    i, j = a + len_a - 1, len_b - 1
+    dest = b + len_b - 1
+    min_gallop = MIN_GALLOP
+
+    while i >= a and j >= 0:
+        count_a = count_b = 0
+        while i >= a and j >= 0:
+            if tmp[j] < arr[i]:
+                arr[dest] = arr[i]
+                i -= 1
+                count_a += 1
+                count_b = 0
+            else:
+                arr[dest] = tmp[j]
+                j -= 1
+                count_b += 1
+                count_a = 0
+            dest -= 1
+            if count_a >= min_gallop or count_b >= min_gallop:
+                break
+
+        while i >= a and j >= 0:
+            p = _gallop(tmp[j], arr, a, i + 1, right=True, from_end=True)
+            k = i + 1 - p
+            arr[dest - k + 1:dest + 1] = arr[p:i + 1]
+            dest -= k
+            i -= k
+            if i < a:
+                break
+
+            q = _gallop(arr[i], tmp, 0, j + 1, right=False, from_end=True)
+            k2 = j + 1 - q
+            arr[dest - k2 + 1:dest + 1] = tmp[q:j + 1]
+            dest -= k2
+            j -= k2
+
+            if k < MIN_GALLOP and k2 < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    if j >= 0:
+        arr[a:a + j + 1] = tmp[0:j + 1]
+
+
+def _gallop(key, seq, lo, hi, right, from_end):
+    """
+    Finds where key belongs in the sorted seq[lo:hi].
+
+    Exponential search from one end brackets the position, then bisect
+    finishes the job, so the cost is O(log d) for a distance d from that end.
+
+    Args:
+        right (bool): Place key after equal elements (bisect_right).
+        from_end (bool): Start the search at hi instead of lo.
+
+    Returns:
+        int: The insertion index.
+    """
+    find = bisect_right if right else bisect_left
+    last, ofs = 0, 1
+    if from_end:
+        # Элементы справа от позиции: > key (right) или >= key (left)
+        while ofs <= hi - lo and (
+            key < seq[hi - ofs] if right else not seq[hi - ofs] < key
+        ):
+            last, ofs = ofs, ofs * 2
+        return find(seq, key, max(lo, hi - ofs + 1), hi - last)
+
+    # Элементы слева от позиции: <= key (right) или < key (left)
+    while ofs <= hi - lo and (
+        not key < seq[lo + ofs - 1] if right else seq[lo + ofs - 1] < key
+    ):
+        last, ofs = ofs, ofs * 2
+    return find(seq, key, lo + last, min(lo + ofs - 1, hi))
@@ -0,0 +1,98 @@
+"""
+This module contains a NumPy backend for sorting flower datasets.
+
+The data is converted to integer codes once and then sorted by NumPy:
+a FlowerTable is sorted directly in its own buffer, and a list of Flower
+objects is ordered by ``np.lexsort`` over the (name, color, aroma) code
+columns. After the conversion there are no per-element Python calls.
+
+Functions:
+    - flower_codes(data): Encodes name, color and aroma as code columns.
+    - argsort_flowers(data): Returns the sorting permutation.
+    - numpy_sort(arr): Sorts the array in place.
+
+Example usage:
+    >>> arr = [4, 10, 3, 5, 1]
+    >>> numpy_sort(arr)
+    >>> print(arr)
+    [1, 3, 4, 5, 10]
+"""
+
+from array import array
+
+import numpy as np
+
+from .radix import FLOWER_FIELDS, _write_back
+
+
+def flower_codes(data):
+    """
+    Encodes the (name, color, aroma) fields of flowers as integer columns.
+
+    Codes follow the string order, so comparing codes is the same as
+    comparing the strings.
+
+    Args:
+        data (list): The flowers.
+
+    Returns:
+        list: One integer array per field of FLOWER_FIELDS.
+    """
+    columns = []
+    for field in FLOWER_FIELDS:
+        values = np.array([getattr(x, field) for x in data])
+        _, codes = np.unique(values, return_inverse=True)
+        columns.append(codes.reshape(-1))
+    return columns
+
+
+def argsort_flowers(data):
+    """
+    Returns the permutation that stably sorts the flowers.
+
+    Args:
+        data (list): Flowers or a FlowerTable.
+
+    Returns:
+        numpy.ndarray: Indexes of the elements in sorted order.
+    """
+    if len(data) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if hasattr(data, "sort_key"):
+        keys = np.frombuffer(data, dtype=np.uint64) >> np.uint64(data.bits)
+        return np.argsort(keys, kind="stable")
+
+    name, color, aroma = flower_codes(data)
+    # Последний ключ в lexsort - главный
+    return np.lexsort((aroma, color, name))
+
+
+def numpy_sort(arr):
+    """
+    Sorts the given array in place with NumPy.
+
+    Args:
+        arr (list): Flowers, a FlowerTable or any mutable sequence of
+            numbers, including array.array.
+
+    Returns:
+        list: The same array, sorted.
+    """
+    if len(arr) < 2:
+        return arr
+
+    if isinstance(arr, array):
+        # FlowerTable и array.array сортируются прямо в своем буфере
+        view = np.frombuffer(arr, dtype=arr.typecode)
+        view.sort(kind="stable")
+        del view
+        return arr
+
+    if hasattr(arr[0], FLOWER_FIELDS[0]):
+        items = list(arr)
+        arr[:] = [items[i] for i in argsort_flowers(items).tolist()]
+        return arr
+
+    _write_back(arr, np.sort(np.asarray(arr), kind="stable").tolist())
+    return arr
@@ -0,0 +1,138 @@
+"""
+This module contains a multi-core sort built on top of the single-core sorts.
+
+The input is split into one chunk per worker, every chunk is sorted in a
+ProcessPoolExecutor with any of the sorts from this package, and the sorted
+runs are combined with a k-way heap merge.
+
+Flower objects are never pickled: every flower is encoded as one integer
+(the mixed-radix rank of its (name, color, aroma) followed by its index in
+the input), so chunks travel to the workers as compact ``array('Q')``
+buffers. The index makes every key unique, so the result is the stable
+sorted order and does not depend on the number of workers. Other inputs,
+including a FlowerTable, are sent as they are.
+
+Functions:
+    - parallel_sort(data, workers, algorithm): Sorts the data in place.
+    - benchmark_workers(data, max_workers, algorithm): Measures throughput.
+
+Example usage:
+    >>> arr = [4, 10, 3, 5, 1]
+    >>> parallel_sort(arr, workers=2)
+    >>> print(arr)
+    [1, 3, 4, 5, 10]
+"""
+
+import heapq
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+
+from .quicksort import quick_sort
+from .radix import FLOWER_FIELDS, _write_back
+
+
+def parallel_sort(data, workers=None, algorithm=quick_sort):
+    """
+    Sorts the data in place using several processes.
+
+    Args:
+        data (list): Flowers, ints or a FlowerTable.
+        workers (int): Number of processes. Defaults to the number of CPUs.
+        algorithm (callable): In-place sort applied to every chunk. Must be
+            a module-level function so that it can be pickled.
+
+    Returns:
+        list: The same data, sorted.
+    """
+    n = len(data)
+    if n < 2:
+        return data
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+
+    if hasattr(data[0], FLOWER_FIELDS[0]):
+        keys, mask = _encode(data)
+    else:
+        keys, mask = data, None
+
+    step = -(-n // workers)
+    chunks = [_pack(keys[i:i + step]) for i in range(0, n, step)]
+
+    if workers == 1:
+        runs = [_sort_chunk(algorithm, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            runs = list(executor.map(_sort_chunk, [algorithm] * len(chunks), chunks))
+
+    merged = heapq.merge(*runs)
+    if mask is None:
+        _write_back(data, merged)
+    else:
+        items = list(data)
+        data[:] = [items[key & mask] for key in merged]
+    return data
+
+
+def benchmark_workers(data, max_workers=None, algorithm=quick_sort):
+    """
+    Measures parallel_sort throughput for 1..max_workers processes.
+
+    Every run sorts a fresh copy of the data.
+
+    Args:
+        data (list): The data to be sorted.
+        max_workers (int): Largest number of processes. Defaults to the
+            number of CPUs.
+        algorithm (callable): The chunk sort.
+
+    Returns:
+        list: Tuples (workers, seconds, rows per second).
+    """
+    results = []
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        copy = data.copy()
+        start_time = time.perf_counter()
+        parallel_sort(copy, workers=workers, algorithm=algorithm)
+        elapsed = time.perf_counter() - start_time
+        results.append((workers, elapsed, len(copy) / elapsed))
+    return results
+
+
+def _encode(data):
+    # Ранг (name, color, aroma) в смешанной системе счисления плюс индекс
+    key = [0] * len(data)
+    for field in FLOWER_FIELDS:
+        getter = attrgetter(field)
+        values = sorted({getter(x) for x in data})
+        rank = {value: i for i, value in enumerate(values)}
+        base = len(values)
+        key = [k * base + rank[getter(x)] for k, x in zip(key, data)]
+
+    shift = max(1, (len(data) - 1).bit_length())
+    return [k << shift | i for i, k in enumerate(key)], (1 << shift) - 1
+
+
+def _pack(keys):
+    # Компактный буфер, если ключи помещаются в 64 бита
+    try:
+        return array("Q", keys)
+    except (OverflowError, TypeError):
+        return list(keys)
+
+
+def _sort_chunk(algorithm, chunk):
+    algorithm(chunk)
+    return chunk
+
+
+if __name__ == "__main__":
+    from loguru import logger
+
+    from data.read import read_plants_table
+
+    logger.add('times.log')
+    table = read_plants_table('data/plants.csv')
+    for workers, elapsed, rate in benchmark_workers(table):
+        logger.info(f'Parallel {workers} workers: {elapsed} seconds, {rate:.0f} rows/s')
@@ -1,19 +1,146 @@
-def quick_sort(arr):
+from .heap import heap_sort
+
+# Отрезки не длиннее этого порога досортировываются вставками
+INSERTION_THRESHOLD = 16
+# Начиная с этой длины опорный элемент выбирается по "ninther"
+NINTHER_THRESHOLD = 40
+
+
+def quick_sort(arr, key=None):
     """
-    Sorts an array using the quick sort algorithm.
+    Sorts an array in place using introsort.
+
+    Quick sort with 3-way (Dutch flag) partitioning and median-of-three /
+    ninther pivot selection. Short slices are finished with insertion sort
+    and a slice that exceeds the depth limit of 2*log2(n) is handed to
+    heap_sort, so the worst case stays O(n log n) and the recursion depth
+    is bounded by O(log n). The sort is not stable.
 
-    @param arr: The array to be sorted.
+    @param arr: The array to be sorted, modified in place.
     @type arr: list
 
-    @return: The sorted array.
+    @param key: Function computing the comparison key of an element. Keys
+        are computed once per element.
+    @type key: callable
+
+    @return: The same array, sorted.
     @rtype: list
     """
-    if len(arr) <= 1:
+    n = len(arr)
+    if n < 2:
         return arr
 
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
+    if key is None:
+        keys, items = arr, None
+    else:
+        keys, items = [key(x) for x in arr], arr
+
+    _introsort(keys, items, 0, n, 2 * n.bit_length())
+    return arr
+
+
+def _introsort(keys, items, lo, hi, depth):
+    # Рекурсия идет только в меньшую часть, большая обрабатывается в цикле
+    while hi - lo > INSERTION_THRESHOLD:
+        if depth == 0:
+            _heap_sort_range(keys, items, lo, hi)
+            return
+        depth -= 1
+
+        pivot = keys[_choose_pivot(keys, lo, hi)]
+        lt, gt = _partition(keys, items, lo, hi, pivot)
+
+        if lt - lo < hi - gt:
+            _introsort(keys, items, lo, lt, depth)
+            lo = gt
+        else:
+            _introsort(keys, items, gt, hi, depth)
+            hi = lt
+
+    _insertion_sort(keys, items, lo, hi)
+
+
+def _partition(keys, items, lo, hi, pivot):
+    """
+    Splits keys[lo:hi] into < pivot, == pivot and > pivot parts.
+
+    @return: Bounds (lt, gt) of the part equal to the pivot.
+    @rtype: tuple
+    """
+    lt = i = lo
+    gt = hi
+    while i < gt:
+        k = keys[i]
+        if k < pivot:
+            keys[lt], keys[i] = k, keys[lt]
+            if items is not None:
+                items[lt], items[i] = items[i], items[lt]
+            lt += 1
+            i += 1
+        elif pivot < k:
+            gt -= 1
+            keys[gt], keys[i] = k, keys[gt]
+            if items is not None:
+                items[gt], items[i] = items[i], items[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _choose_pivot(keys, lo, hi):
+    mid = (lo + hi) // 2
+    last = hi - 1
+    if hi - lo < NINTHER_THRESHOLD:
+        return _median_of_three(keys, lo, mid, last)
+
+    step = (hi - lo) // 8
+    return _median_of_three(
+        keys,
+        _median_of_three(keys, lo, lo + step, lo + 2 * step),
+        _median_of_three(keys, mid - step, mid, mid + step),
+        _median_of_three(keys, last - 2 * step, last - step, last),
+    )
+
+
+def _median_of_three(keys, a, b, c):
+    ka, kb, kc = keys[a], keys[b], keys[c]
+    if ka < kb:
+        if kb < kc:
+            return b
+        return c if ka < kc else a
+    if ka < kc:
+        return a
+    return c if kb < kc else b
+
+
+def _insertion_sort(keys, items, lo, hi):
+    for i in range(lo + 1, hi):
+        k = keys[i]
+        item = items[i] if items is not None else None
+        j = i - 1
+        while j >= lo and k < keys[j]:
+            keys[j + 1] = keys[j]
+            if items is not None:
+                items[j + 1] = items[j]
+            j -= 1
+        keys[j + 1] = k
+        if items is not None:
+            items[j + 1] = item
+
+
+def _heap_sort_range(keys, items, lo, hi):
+    # Вырожденный случай: глубина рекурсии исчерпана
+    if items is None:
+        block = keys[lo:hi]
+        heap_sort(block)
+        keys[lo:hi] = block
+        return
 
-    return quick_sort(left) + middle + quick_sort(right)
+    # Индекс в паре не дает сравнивать сами ключи при равенстве
+    block = [(keys[i], i) for i in range(lo, hi)]
+    heap_sort(block)
+    moved = [items[i] for _, i in block]
+    # Поэлементная запись: срез array.array нельзя заменить списком
+    for j, (k, _) in enumerate(block, lo):
+        keys[j] = k
+        items[j] = moved[j - lo]
@@ -0,0 +1,136 @@
+"""
+This module contains a stable counting / LSD radix sort for low-cardinality keys.
+
+The Flower ordering only looks at (name, color, aroma), and the generated
+data draws them from 5 x 5 x 3 = 75 combinations. Instead of comparing
+elements, the sort learns the universe of every field (from the data or
+from a declared schema), distributes the elements into one bucket per
+value, and repeats this from the least significant field to the most
+significant one. Each pass is stable, so the whole sort is O(fields * (n + k)).
+
+Functions:
+    - counting_sort(arr, key, universe): Stable bucket sort by a single key.
+    - radix_sort(arr, fields, schema): LSD radix sort over several fields.
+    - is_low_cardinality(arr, fields, limit, per_key): Checks if radix_sort pays off.
+
+Example usage:
+    >>> arr = [Flower("Роза", "Белый", "Слабый", "Азия"),
+    ...        Flower("Пион", "Белый", "Слабый", "Азия")]
+    >>> radix_sort(arr)
+    >>> [f.name for f in arr]
+    ['Пион', 'Роза']
+"""
+
+from itertools import chain
+from operator import attrgetter
+
+FLOWER_FIELDS = ("name", "color", "aroma")
+# Максимальное число различных ключей, для которых заводятся корзины
+LOW_CARDINALITY = 1 << 16
+# Минимальное среднее число элементов на одно значение ключа
+MIN_PER_KEY = 4
+
+
+def counting_sort(arr, key, universe=None):
+    """
+    Stably sorts the array in place by one key with a bucket per key value.
+
+    Args:
+        arr (list): The array to be sorted.
+        key (callable): Function computing the key of an element.
+        universe (iterable): All possible key values. Learned from the data
+            if omitted.
+
+    Raises:
+        ValueError: If an element has a key outside the declared universe.
+    """
+    keys = [key(x) for x in arr]
+    if universe is None:
+        universe = set(keys)
+    rank = {value: i for i, value in enumerate(sorted(universe))}
+
+    buckets = [[] for _ in rank]
+    try:
+        for x, k in zip(arr, keys):
+            buckets[rank[k]].append(x)
+    except KeyError as e:
+        raise ValueError(f"Key {e.args[0]!r} is not in the universe") from None
+
+    _write_back(arr, chain.from_iterable(buckets))
+
+
+def radix_sort(arr, fields=None, schema=None):
+    """
+    Sorts the array in place with a stable LSD radix sort.
+
+    Args:
+        arr (list): The array to be sorted. A FlowerTable is sorted by its
+            packed sort key in a single pass.
+        fields (sequence): Attribute names or key functions, most
+            significant first. Defaults to the Flower ordering for flowers
+            and to the elements themselves otherwise, e.g. for ints.
+        schema (dict): Optional mapping from a field to all of its possible
+            values. Fields missing from it are learned from the data.
+
+    Returns:
+        list: The same array, sorted.
+    """
+    if fields is None:
+        fields = _default_fields(arr)
+    schema = schema or {}
+
+    for field in reversed(fields):
+        key = attrgetter(field) if isinstance(field, str) else field
+        counting_sort(arr, key, schema.get(field))
+    return arr
+
+
+def is_low_cardinality(arr, fields=None, limit=LOW_CARDINALITY, per_key=MIN_PER_KEY):
+    """
+    Checks whether the array has few enough distinct keys for radix_sort.
+
+    Buckets only pay off when they are shared: a field with nearly as many
+    values as elements makes radix_sort a comparison sort of the values
+    plus the bucket overhead.
+
+    Args:
+        arr (list): The array to be checked.
+        fields (sequence): Same as in radix_sort.
+        limit (int): Maximum number of distinct values in a single field.
+        per_key (int): Minimum average number of elements per value.
+
+    Returns:
+        bool: True if every field has at most
+        min(limit, len(arr) // per_key) values.
+    """
+    if fields is None:
+        fields = _default_fields(arr)
+    bound = min(limit, len(arr) // per_key)
+
+    for field in fields:
+        key = attrgetter(field) if isinstance(field, str) else field
+        if len(set(map(key, arr))) > bound:
+            return False
+    return True
+
+
+def _default_fields(arr):
+    # FlowerTable хранит упакованные ключи и умеет отбрасывать регион
+    if hasattr(arr, "sort_key"):
+        return (arr.sort_key,)
+    if len(arr) and not hasattr(arr[0], FLOWER_FIELDS[0]):
+        # Числа, например закодированные цветы из parallel_sort
+        return (_identity,)
+    return FLOWER_FIELDS
+
+
+def _identity(x):
+    return x
+
+
+def _write_back(arr, items):
+    if isinstance(arr, list):
+        arr[:] = items
+        return
+    for i, x in enumerate(items):
+        arr[i] = x
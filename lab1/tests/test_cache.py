@@ -0,0 +1,39 @@
+import os
+
+from data import cache
+from data.gen import write_csv
+from data.read import _parse_table
+
+
+def test_touched_csv_is_hashed_once(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / "plants.csv")
+    write_csv(csv_path, 300, seed=5)
+    expected = list(cache.load_table(csv_path, _parse_table))
+
+    calls = []
+    real_hash = cache.file_hash
+
+    def counting_hash(path):
+        calls.append(path)
+        return real_hash(path)
+
+    monkeypatch.setattr(cache, "file_hash", counting_hash)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    for _ in range(3):
+        table = cache.load_table(csv_path, lambda path: None)
+        assert list(table) == expected
+    assert len(calls) == 1
+
+
+def test_changed_csv_is_rebuilt(tmp_path):
+    csv_path = str(tmp_path / "plants.csv")
+    write_csv(csv_path, 300, seed=5)
+    cache.load_table(csv_path, _parse_table)
+
+    write_csv(csv_path, 300, seed=6)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert list(cache.load_table(csv_path, _parse_table)) == list(_parse_table(csv_path))
@@ -0,0 +1,51 @@
+import pytest
+
+from data.flower import Flower
+from data.gen import DISTRIBUTIONS, generate_plants_data
+from data.table import FlowerTable
+from sorts import quicksort
+
+
+@pytest.fixture
+def fallbacks(monkeypatch):
+    calls = []
+    heap_sort_range = quicksort._heap_sort_range
+
+    def spy(keys, items, lo, hi):
+        calls.append(hi - lo)
+        heap_sort_range(keys, items, lo, hi)
+
+    monkeypatch.setattr(quicksort, "_heap_sort_range", spy)
+    return calls
+
+
+@pytest.mark.parametrize("size", [1000, 20000])
+def test_quicksort_killer_reaches_heap_fallback(size, fallbacks):
+    rows = generate_plants_data(size, "quicksort_killer", seed=1)
+    flowers = [Flower(*row) for row in rows]
+    table = FlowerTable.from_rows(rows)
+
+    expected = sorted(flowers)
+    quicksort.quick_sort(flowers)
+    assert flowers == expected
+    # Глубина исчерпана, пока почти весь вход еще не разделен
+    assert len(fallbacks) == 1
+    assert fallbacks[0] > size * 0.8
+
+    expected = sorted(table)
+    quicksort.quick_sort(table)
+    assert list(table) == expected
+    assert len(fallbacks) == 2
+
+
+def test_random_input_does_not_reach_heap_fallback(fallbacks):
+    flowers = [Flower(*row) for row in generate_plants_data(20000, "random", seed=1)]
+    quicksort.quick_sort(flowers)
+    assert fallbacks == []
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_distributions_are_seeded(distribution):
+    rows = generate_plants_data(3000, distribution, seed=7)
+    assert len(rows) == 3000
+    assert rows == generate_plants_data(3000, distribution, seed=7)
@@ -0,0 +1,74 @@
+import heapq
+import random
+
+import pytest
+
+from data.gen import generate_plants_data
+from data.table import FlowerTable
+from sorts.heap import Heap, heap_sort, nlargest, nsmallest, partial_sort
+
+SIZE = 5000
+
+
+def _inputs(n):
+    rng = random.Random(n)
+    values = [rng.randrange(n) for _ in range(n)]
+    half = n // 2
+    return {
+        "random": values,
+        "sorted": sorted(values),
+        "reversed": sorted(values, reverse=True),
+        "equal": [7] * n,
+        "two_values": [rng.randrange(2) for _ in range(n)],
+        "organ_pipe": list(range(half)) + list(range(n - half, 0, -1)),
+        "sawtooth": [i % 17 for i in range(n)],
+    }
+
+
+@pytest.mark.parametrize("d", [2, 3, 4, 8])
+@pytest.mark.parametrize("distribution", list(_inputs(10)))
+def test_heap_sort_matches_sorted(distribution, d):
+    values = _inputs(SIZE)[distribution]
+    arr = list(values)
+    heap_sort(arr, d)
+    assert arr == sorted(values)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 5, 9, 10])
+def test_heap_sort_small(n):
+    for values in _inputs(n).values():
+        arr = list(values)
+        heap_sort(arr)
+        assert arr == sorted(values)
+
+
+def test_heap_sort_deep_input():
+    # Глубина кучи ~ 18 уровней; рекурсивная версия не нужна
+    values = list(range(200000, 0, -1))
+    heap_sort(values)
+    assert values == list(range(1, 200001))
+
+
+def test_heap_sort_flower_table():
+    table = FlowerTable.from_rows(generate_plants_data(2000, seed=4))
+    expected = sorted(table)
+    heap_sort(table)
+    assert list(table) == expected
+
+
+@pytest.mark.parametrize("d", [2, 4])
+def test_top_k(d):
+    values = _inputs(SIZE)["random"]
+    for k in (0, 1, 10, SIZE):
+        arr = list(values)
+        partial_sort(arr, k, d)
+        assert arr[:k] == sorted(values)[:k]
+        assert nsmallest(k, values, d=d) == heapq.nsmallest(k, values)
+        assert nlargest(k, values, key=lambda x: -x, d=d) == heapq.nlargest(k, values, key=lambda x: -x)
+
+
+@pytest.mark.parametrize("d", [2, 3])
+def test_heap_pops_in_order(d):
+    values = _inputs(SIZE)["random"]
+    heap = Heap(values, d)
+    assert [heap.pop() for _ in range(len(values))] == sorted(values)
@@ -0,0 +1,38 @@
+from data.flower import Flower
+from sorts.heap import heap_sort
+from sorts.instrument import CountingList, measure_costs
+from sorts.quicksort import _heap_sort_range
+
+
+def test_flower_le_counts_nested_comparisons():
+    flowers = [Flower("Роза", "Белый", "Слабый", "Азия")] * 2
+
+    costs = measure_costs(lambda arr: arr[0] <= arr[1], flowers, memory=False, calls=False)
+    # __le__ вызывает __lt__, а при неравенстве еще и __eq__
+    assert costs["comparisons"]["le"] == 1
+    assert costs["comparisons"]["lt"] == 1
+    assert costs["comparisons"]["eq"] == 1
+    assert costs["comparisons"]["total"] == 3
+
+
+def test_writes_into_slices_are_counted():
+    arr = CountingList([5, 4, 3, 2, 1])
+    block = arr[1:4]
+    block[0], block[2] = block[2], block[0]
+
+    assert arr.writes == 2
+    assert arr.swaps == 1
+    assert list(arr) == [5, 4, 3, 2, 1]
+
+
+def test_quick_sort_heap_fallback_writes_are_counted():
+    values = list(range(64, 0, -1))
+
+    def heap_fallback(arr):
+        _heap_sort_range(arr, None, 0, len(arr))
+
+    fallback = measure_costs(heap_fallback, values, memory=False, calls=False)
+    direct = measure_costs(heap_sort, values, memory=False, calls=False)
+    # Запись блока обратно добавляет по одной записи на элемент
+    assert fallback["writes"] == direct["writes"] + len(values)
+    assert fallback["comparisons"] == direct["comparisons"]
@@ -0,0 +1,28 @@
+import random
+from array import array
+
+import pytest
+
+from data.gen import generate_plants_data
+from data.table import FlowerTable
+from sorts.numpy_sort import numpy_sort
+
+
+@pytest.mark.parametrize("typecode", ["Q", "q", "i", "H", "d"])
+def test_sorts_array_in_place(typecode):
+    rng = random.Random(typecode)
+    values = [rng.randrange(0, 1000) for _ in range(500)]
+    arr = array(typecode, values)
+
+    assert numpy_sort(arr) is arr
+    assert arr == array(typecode, sorted(values))
+
+
+def test_sorts_list_and_flower_table():
+    values = [random.random() for _ in range(500)]
+    assert numpy_sort(list(values)) == sorted(values)
+
+    table = FlowerTable.from_rows(generate_plants_data(500, seed=1))
+    expected = sorted(table)
+    numpy_sort(table)
+    assert list(table) == expected
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from data.gen import generate_plants_data
+from data.table import FlowerTable
+from sorts.heap import heap_sort
+from sorts.merge import merge_sort
+from sorts.numpy_sort import numpy_sort
+from sorts.parallel import parallel_sort
+from sorts.quicksort import quick_sort
+from sorts.radix import radix_sort
+from sorts.selection import selection_sort
+
+ALGORITHMS = [quick_sort, heap_sort, selection_sort, merge_sort, radix_sort, numpy_sort]
+
+
+def flower_key(flower):
+    return (flower.name, flower.color, flower.aroma)
+
+
+@pytest.fixture(scope="module")
+def table():
+    return FlowerTable.from_rows(generate_plants_data(600, seed=3))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sorts_flowers(algorithm, workers, table):
+    flowers = table.to_flowers()
+    expected = sorted(flowers, key=flower_key)
+
+    parallel_sort(flowers, workers=workers, algorithm=algorithm)
+
+    # Порядок стабильный, поэтому совпадают сами объекты
+    assert [id(x) for x in flowers] == [id(x) for x in expected]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sorts_ints_and_tables(algorithm, workers, table):
+    rng = random.Random(0)
+    ints = [rng.randrange(-1000, 1000) for _ in range(600)]
+    expected = sorted(ints)
+    parallel_sort(ints, workers=workers, algorithm=algorithm)
+    assert ints == expected
+
+    copy = table.copy()
+    parallel_sort(copy, workers=workers, algorithm=algorithm)
+    assert list(copy) == sorted(table)
@@ -0,0 +1,41 @@
+import random
+from array import array
+
+import pytest
+
+from data.gen import generate_plants_data
+from data.table import FlowerTable
+from sorts.quicksort import _introsort, quick_sort
+
+
+def _sort_with_heap_fallback(arr, key):
+    # Нулевая глубина сразу передает весь отрезок heap_sort
+    keys = [key(x) for x in arr]
+    _introsort(keys, arr, 0, len(arr), 0)
+    return arr
+
+
+@pytest.mark.parametrize("make", [list, lambda values: array("q", values)])
+def test_heap_fallback_with_key(make):
+    rng = random.Random(2)
+    values = [rng.randrange(-1000, 1000) for _ in range(300)]
+    arr = make(values)
+
+    _sort_with_heap_fallback(arr, key=lambda x: -x)
+    assert list(arr) == sorted(values, reverse=True)
+
+
+def test_heap_fallback_with_key_on_flower_table():
+    table = FlowerTable.from_rows(generate_plants_data(300, seed=3))
+    expected = sorted(table, key=lambda code: -code)
+
+    _sort_with_heap_fallback(table, key=lambda code: -code)
+    assert list(table) == expected
+
+
+@pytest.mark.parametrize("n", [0, 1, 17, 1000])
+def test_matches_sorted(n):
+    rng = random.Random(n)
+    values = [rng.randrange(50) for _ in range(n)]
+    assert quick_sort(list(values)) == sorted(values)
+    assert quick_sort(list(values), key=lambda x: -x) == sorted(values, key=lambda x: -x)
@@ -0,0 +1,31 @@
+import random
+
+from data.flower import Flower
+from data.gen import generate_plants_data
+from data.table import FlowerTable
+from sorts.radix import is_low_cardinality, radix_sort
+
+
+def test_all_distinct_input_is_not_low_cardinality():
+    flowers = [Flower(f"Цветок {i}", "Белый", "Слабый", "Азия") for i in range(50000)]
+    assert not is_low_cardinality(flowers)
+
+    ints = list(range(1000))
+    random.Random(0).shuffle(ints)
+    assert not is_low_cardinality(ints)
+
+
+def test_generated_plants_are_low_cardinality():
+    table = FlowerTable.from_rows(generate_plants_data(5000, seed=2))
+    assert is_low_cardinality(table)
+    assert is_low_cardinality(table.to_flowers())
+
+
+def test_radix_sort_is_stable():
+    table = FlowerTable.from_rows(generate_plants_data(2000, seed=4))
+    flowers = table.to_flowers()
+    expected = sorted(flowers, key=lambda x: (x.name, x.color, x.aroma))
+
+    radix_sort(flowers)
+
+    assert [id(x) for x in flowers] == [id(x) for x in expected]
@@ -0,0 +1,36 @@
+import csv
+
+import pytest
+
+from data.read import FIELDS, read_plants_data, read_plants_table
+
+
+def _write_rows(path, rows):
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(FIELDS)
+        writer.writerows(rows)
+
+
+def test_many_distinct_strings_fall_back_to_csv_parse(tmp_path):
+    csv_path = str(tmp_path / "plants.csv")
+    rows = [[f"name{i}", "Белый", "Слабый", f"region{i}"] for i in range(40000)]
+    _write_rows(csv_path, rows)
+
+    # 80002 строки не помещаются в 16-битные коды упакованного ключа
+    with pytest.raises(ValueError):
+        read_plants_table(csv_path)
+
+    flowers = read_plants_data(csv_path)
+    assert [[f.name, f.color, f.aroma, f.regions] for f in flowers] == rows
+    assert flowers == read_plants_data(csv_path, cache=False)
+
+
+def test_cached_read_matches_csv_parse(tmp_path):
+    csv_path = str(tmp_path / "plants.csv")
+    rows = [[f"name{i % 7}", "Белый", "Слабый", f"region{i % 3}"] for i in range(100)]
+    _write_rows(csv_path, rows)
+
+    expected = read_plants_data(csv_path, cache=False)
+    assert read_plants_data(csv_path) == expected
+    assert read_plants_data(csv_path) == expected
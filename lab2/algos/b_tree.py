@@ -0,0 +1,221 @@
+from bisect import bisect_left, bisect_right
+
+from .bulk import group_items
+
+DEFAULT_ORDER = 64
+
+
+class Leaf:
+    __slots__ = ("keys", "values", "next")
+
+    def __init__(self, keys, values, next=None):
+        self.keys = keys
+        # values[i] - список всех значений ключа keys[i]
+        self.values = values
+        # Следующий лист для просмотра диапазонов
+        self.next = next
+
+
+class Inner:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys, children):
+        # keys[i] - наименьший ключ поддерева children[i + 1]
+        self.keys = keys
+        self.children = children
+
+
+class BPlusTree:
+    """
+    Ordered multimap stored as a B+ tree.
+
+    Every node holds up to order keys in a Python list searched with
+    bisect, so a lookup does height ~ log_order(n) list bisections instead
+    of one attribute-chasing step per binary level. Values live only in the
+    leaves, which are linked left to right for range scans. All leaves are
+    on the same depth, so descending needs no type checks.
+    """
+
+    def __init__(self, order=DEFAULT_ORDER):
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self.root = Leaf([], [])
+        # Число уровней внутренних узлов над листьями
+        self.height = 0
+        # Число различных ключей и число пар
+        self.size = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return self.range()
+
+    @classmethod
+    def from_items(cls, items, presorted=False, order=DEFAULT_ORDER):
+        """
+        Builds the tree from (key, value) pairs bottom-up in O(n).
+
+        The pairs are sorted once, unless presorted is set. Nodes are filled
+        evenly, level by level.
+        """
+        tree = cls(order)
+        groups = group_items(items, presorted)
+        if not groups:
+            return tree
+
+        leaves = []
+        for chunk in _chunks(groups, order):
+            leaf = Leaf([key for key, _ in chunk], [values for _, values in chunk])
+            if leaves:
+                leaves[-1].next = leaf
+            leaves.append(leaf)
+        level = [(leaf.keys[0], leaf) for leaf in leaves]
+
+        while len(level) > 1:
+            level = [
+                (chunk[0][0], Inner([key for key, _ in chunk[1:]], [node for _, node in chunk]))
+                for chunk in _chunks(level, order + 1)
+            ]
+            tree.height += 1
+
+        tree.root = level[0][1]
+        tree.size = len(groups)
+        tree.count = sum(len(values) for _, values in groups)
+        return tree
+
+    bulk_load = from_items
+
+    def insert(self, key, data):
+        path = []
+        node = self.root
+        for _ in range(self.height):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        i = bisect_left(node.keys, key)
+        self.count += 1
+        if i < len(node.keys) and not key < node.keys[i]:
+            node.values[i].append(data)
+            return
+        node.keys.insert(i, key)
+        node.values.insert(i, [data])
+        self.size += 1
+        if len(node.keys) <= self.order:
+            return
+
+        # Разделение листа и, при необходимости, предков
+        separator, right = self._split_leaf(node)
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+            if len(parent.keys) <= self.order:
+                return
+            separator, right = self._split_inner(parent)
+
+        self.root = Inner([separator], [self.root, right])
+        self.height += 1
+
+    def search(self, key):
+        leaf, i = self._find(key)
+        if i < len(leaf.keys) and not key < leaf.keys[i]:
+            return list(leaf.values[i])
+        return []
+
+    def search_many(self, keys):
+        """
+        Looks up a batch of keys in key order.
+
+        The sorted keys are answered leaf by leaf: a key that lies in the
+        current leaf or in the next one costs one bisect, and the tree is
+        descended from the root again only when the keys jump further.
+
+        Returns:
+            dict: Key -> list of its values, as returned by search.
+        """
+        found = {}
+        leaf = None
+        for key in sorted(set(keys)):
+            if leaf is None or (leaf.keys and leaf.keys[-1] < key):
+                following = leaf.next if leaf is not None else None
+                if following is not None and not following.keys[-1] < key:
+                    leaf = following
+                else:
+                    leaf = self._find(key)[0]
+            i = bisect_left(leaf.keys, key)
+            if i < len(leaf.keys) and not key < leaf.keys[i]:
+                found[key] = list(leaf.values[i])
+            else:
+                found[key] = []
+        return found
+
+    def range(self, lo=None, hi=None):
+        """
+        Yields the (key, value) pairs with lo <= key <= hi in key order.
+
+        A bound of None is open. The scan descends to the leaf of lo once
+        and then follows the leaf links.
+        """
+        if lo is None:
+            leaf = self.root
+            for _ in range(self.height):
+                leaf = leaf.children[0]
+            i = 0
+        else:
+            leaf, i = self._find(lo)
+
+        while leaf is not None:
+            keys = leaf.keys
+            for j in range(i, len(keys)):
+                key = keys[j]
+                if hi is not None and hi < key:
+                    return
+                for value in leaf.values[j]:
+                    yield key, value
+            leaf = leaf.next
+            i = 0
+
+    def keys(self):
+        leaf = self.root
+        for _ in range(self.height):
+            leaf = leaf.children[0]
+        while leaf is not None:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    def _find(self, key):
+        node = self.root
+        for _ in range(self.height):
+            node = node.children[bisect_right(node.keys, key)]
+        return node, bisect_left(node.keys, key)
+
+    def _split_leaf(self, leaf):
+        mid = len(leaf.keys) // 2
+        right = Leaf(leaf.keys[mid:], leaf.values[mid:], leaf.next)
+        del leaf.keys[mid:]
+        del leaf.values[mid:]
+        leaf.next = right
+        return right.keys[0], right
+
+    def _split_inner(self, node):
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        right = Inner(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        return separator, right
+
+
+def _chunks(items, capacity):
+    # Равномерное деление на ceil(n / capacity) частей
+    parts = -(-len(items) // capacity)
+    step, extra = divmod(len(items), parts)
+    start = 0
+    for part in range(parts):
+        end = start + step + (part < extra)
+        yield items[start:end]
+        start = end
@@ -1,7 +1,11 @@
+from .bulk import find_many, group_items, merge_groups, rebuild_pays_off
+
+
 class Node:
-    def __init__(self, key, data):
+    def __init__(self, key, values):
         self.key = key
-        self.data = data
+        # Все значения с одинаковым ключом хранятся в одном узле
+        self.values = values
         self.left = None
         self.right = None
 
@@ -9,38 +13,112 @@ class Node:
 class BinarySearchTree:
     def __init__(self):
         self.root = None
+        # Число узлов, то есть различных ключей
+        self.size = 0
+
+    @classmethod
+    def from_items(cls, items, presorted=False):
+        """
+        Builds a perfectly balanced tree from (key, value) pairs in O(n).
+
+        The pairs are sorted once, unless presorted is set.
+        """
+        tree = cls()
+        tree._rebuild(group_items(items, presorted))
+        return tree
+
+    bulk_load = from_items
+
+    def bulk_insert(self, items, presorted=False):
+        """
+        Inserts a batch of (key, value) pairs.
+
+        A large batch is merged with the in-order contents of the tree and
+        the tree is rebuilt balanced in O(n + m); a small one is inserted
+        pair by pair.
+        """
+        batch = group_items(items, presorted)
+        if rebuild_pays_off(self.size, len(batch)):
+            old = [(node.key, node.values) for node in self._inorder_nodes()]
+            self._rebuild(merge_groups(old, batch))
+            return
+        for key, values in batch:
+            for value in values:
+                self.insert(key, value)
 
     def insert(self, key, data):
         if self.root is None:
-            self.root = Node(key, data)
-        else:
-            self._insert(self.root, key, data)
-
-    def _insert(self, node, key, data):
-        if key < node.key:
-            if node.left is None:
-                node.left = Node(key, data)
-            else:
-                self._insert(node.left, key, data)
-        else:
-            if node.right is None:
-                node.right = Node(key, data)
+            self.root = Node(key, [data])
+            self.size += 1
+            return
+
+        node = self.root
+        while True:
+            if key < node.key:
+                if node.left is None:
+                    node.left = Node(key, [data])
+                    self.size += 1
+                    return
+                node = node.left
+            elif node.key < key:
+                if node.right is None:
+                    node.right = Node(key, [data])
+                    self.size += 1
+                    return
+                node = node.right
             else:
-                self._insert(node.right, key, data)
+                node.values.append(data)
+                return
 
     def search(self, key):
-        return self._search(self.root, key)
-
-    def _search(self, node, key):
-        if node is None:
-            return []
-        elif key == node.key:
-            return (
-                [node.data]
-                + self._search(node.left, key)
-                + self._search(node.right, key)
-            )
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        node = self._find(key)
+        return [] if node is None else list(node.values)
+
+    def search_many(self, keys):
+        """
+        Looks up a batch of keys in one merged traversal of the tree.
+
+        Returns:
+            dict: Key -> list of its values, as returned by search.
+        """
+        return {
+            key: [] if node is None else list(node.values)
+            for key, node in find_many(self.root, None, sorted(set(keys)))
+        }
+
+    def _find(self, key):
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def _inorder_nodes(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def _rebuild(self, groups):
+        self.root = self._build(groups, 0, len(groups))
+        self.size = len(groups)
+
+    def _build(self, groups, lo, hi):
+        # Глубина рекурсии - log2(n)
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        key, values = groups[mid]
+        node = Node(key, values)
+        node.left = self._build(groups, lo, mid)
+        node.right = self._build(groups, mid + 1, hi)
+        return node
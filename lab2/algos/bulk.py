@@ -0,0 +1,91 @@
+from bisect import bisect_left
+from itertools import groupby
+from operator import itemgetter, lt
+
+
+# Вспомогательные функции для построения деревьев из массива пар
+def group_items(items, presorted=False):
+    """
+    Sorts (key, value) pairs once and groups equal keys.
+
+    Values of equal keys keep their input order. With presorted=True the
+    pairs are only checked to be in order.
+
+    Returns:
+        list: Pairs (key, values) with strictly increasing keys.
+    """
+    items = list(items)
+    if not presorted:
+        items.sort(key=itemgetter(0))
+
+    groups = [
+        (key, [value for _, value in group])
+        for key, group in groupby(items, key=itemgetter(0))
+    ]
+    keys = [key for key, _ in groups]
+    if presorted and not all(map(lt, keys, keys[1:])):
+        raise ValueError("Items are not sorted by key")
+    return groups
+
+
+def merge_groups(old, new):
+    """
+    Merges two lists of (key, values) groups with increasing keys.
+
+    For equal keys the values of old go first, as after repeated inserts.
+    """
+    merged = []
+    i = j = 0
+    while i < len(old) and j < len(new):
+        if old[i][0] < new[j][0]:
+            merged.append(old[i])
+            i += 1
+        elif new[j][0] < old[i][0]:
+            merged.append(new[j])
+            j += 1
+        else:
+            merged.append((old[i][0], old[i][1] + new[j][1]))
+            i += 1
+            j += 1
+    merged.extend(old[i:])
+    merged.extend(new[j:])
+    return merged
+
+
+def rebuild_pays_off(size, batch):
+    # Перестроение O(n + m) против m вставок по O(log(n + m))
+    return batch * (size + batch).bit_length() >= size + batch
+
+
+def find_many(root, nil, keys):
+    """
+    Looks up many keys in one traversal of a search tree.
+
+    The sorted keys are split at every visited node into the keys of its
+    left and right subtrees, so the common part of the search paths is
+    walked once and each subtree is entered at most once per batch.
+
+    Args:
+        root: Root of the tree.
+        nil: The empty-subtree marker (None or a sentinel node).
+        keys (list): Sorted keys without duplicates.
+
+    Yields:
+        tuple: (key, node) for every key; node is nil on a miss.
+    """
+    stack = [(root, 0, len(keys))]
+    while stack:
+        node, lo, hi = stack.pop()
+        if node is nil:
+            for key in keys[lo:hi]:
+                yield key, nil
+            continue
+        mid = bisect_left(keys, node.key, lo, hi)
+        right = mid
+        if mid < hi and not node.key < keys[mid]:
+            yield keys[mid], node
+            right += 1
+        if right < hi:
+            stack.append((node.right, right, hi))
+        if lo < mid:
+            stack.append((node.left, lo, mid))
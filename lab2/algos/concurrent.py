@@ -0,0 +1,177 @@
+"""
+Concurrent hash tables built on HashTable.
+
+ConcurrentHashTable splits the keys across shards, each a HashTable with
+its own lock, so writers to different shards never wait for each other.
+Reads take no lock: a HashTable bucket is a list that is only appended
+to, and under the GIL a reader iterating it sees either the old or the
+new contents, never a broken list. Batch operations group the keys by
+shard and take every lock once per batch.
+
+ProcessShardedHashTable runs one worker process per key range. Every
+worker owns the HashTable of its range, so CPU-bound lookups scale past
+the GIL; the caller pays for pickling the batches.
+
+Example usage:
+    >>> table = ConcurrentHashTable(1000, shards=8)
+    >>> table.insert_many([("ab", 1), ("cd", 2)])
+    >>> table.search("cd")
+    2
+"""
+
+import multiprocessing
+import string
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+
+from .hash import HashTable
+
+DEFAULT_SHARDS = 16
+
+
+class ConcurrentHashTable:
+    """
+    Thread-safe HashTable with per-shard locks and lock-free reads.
+
+    Args:
+        size (int): Total number of buckets, split evenly between shards.
+        shards (int): Number of shards and locks.
+    """
+
+    def __init__(self, size, shards=DEFAULT_SHARDS):
+        self.shard_size = max(size // shards, 1)
+        self.shards = [HashTable(self.shard_size) for _ in range(shards)]
+        self.locks = [threading.Lock() for _ in range(shards)]
+
+    def shard_index(self, key):
+        # Корзина внутри шарда - hash % shard_size, поэтому шард берется
+        # из следующих разрядов, иначе часть корзин осталась бы пустой
+        return hash(key) // self.shard_size % len(self.shards)
+
+    def insert(self, key, value):
+        i = self.shard_index(key)
+        with self.locks[i]:
+            self.shards[i].insert(key, value)
+
+    def insert_many(self, items):
+        """Inserts (key, value) pairs, taking each shard lock once."""
+        for i, batch in self._group(items, key=lambda item: item[0]).items():
+            shard = self.shards[i]
+            with self.locks[i]:
+                for key, value in batch:
+                    shard.insert(key, value)
+
+    def search(self, key):
+        return self.shards[self.shard_index(key)].search(key)
+
+    def search_value(self, key, value):
+        return self.shards[self.shard_index(key)].search_value(key, value)
+
+    def search_many(self, keys):
+        found = {}
+        for i, batch in self._group(keys).items():
+            found.update(self.shards[i].search_many(batch))
+        return found
+
+    def _group(self, items, key=None):
+        groups = defaultdict(list)
+        shard_index = self.shard_index
+        for item in items:
+            groups[shard_index(item if key is None else key(item))].append(item)
+        return groups
+
+
+def _serve(connection, size):
+    # Цикл рабочего процесса: команды приходят пачками
+    table = HashTable(size)
+    while True:
+        command, payload = connection.recv()
+        if command == "insert":
+            for key, value in payload:
+                table.insert(key, value)
+            connection.send(None)
+        elif command == "search":
+            connection.send(table.search_many(payload))
+        else:
+            connection.close()
+            return
+
+
+class ProcessShardedHashTable:
+    """
+    HashTable split by key ranges between worker processes.
+
+    Worker i owns the keys k with boundaries[i - 1] <= k < boundaries[i].
+    By default the range of lowercase first letters is split evenly.
+
+    Args:
+        size (int): Total number of buckets, split between workers.
+        workers (int): Number of worker processes.
+        boundaries (list): workers - 1 sorted keys that separate the ranges.
+    """
+
+    def __init__(self, size, workers=None, boundaries=None):
+        workers = workers or multiprocessing.cpu_count()
+        if boundaries is None:
+            letters = string.ascii_lowercase
+            boundaries = [letters[len(letters) * i // workers] for i in range(1, workers)]
+        if len(boundaries) != workers - 1:
+            raise ValueError("Expected workers - 1 boundaries")
+
+        self.boundaries = list(boundaries)
+        self.connections = []
+        self.processes = []
+        for _ in range(workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve, args=(child, max(size // workers, 1)), daemon=True
+            )
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for connection, process in zip(self.connections, self.processes):
+            connection.send(("stop", None))
+            connection.close()
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def worker_index(self, key):
+        return bisect_right(self.boundaries, key)
+
+    def insert_many(self, items):
+        groups = defaultdict(list)
+        for item in items:
+            groups[self.worker_index(item[0])].append(item)
+        # Сначала рассылаем все пачки, потом ждем, чтобы процессы работали параллельно
+        for i, batch in groups.items():
+            self.connections[i].send(("insert", batch))
+        for i in groups:
+            self.connections[i].recv()
+
+    def insert(self, key, value):
+        self.insert_many([(key, value)])
+
+    def search_many(self, keys):
+        groups = defaultdict(list)
+        for key in keys:
+            groups[self.worker_index(key)].append(key)
+        for i, batch in groups.items():
+            self.connections[i].send(("search", batch))
+        found = {}
+        for i in groups:
+            found.update(self.connections[i].recv())
+        return found
+
+    def search(self, key):
+        return self.search_many([key])[key]
@@ -1,7 +1,10 @@
 import random
+from collections import defaultdict
 
 from data.gen import generate_combinations
 
+from .snapshot import HASH_TABLE, MappedIndex, write_snapshot
+
 
 # Реализация хэш таблицы
 class HashTable:
@@ -35,6 +38,29 @@ class HashTable:
                 return item[1]
         return None
 
+    def search_many(self, keys):
+        """
+        Looks up a batch of keys, scanning every bucket once.
+
+        Returns:
+            dict: Key -> first inserted value or None, as returned by search.
+        """
+        by_bucket = defaultdict(set)
+        for key in keys:
+            by_bucket[self.hash_function(key)].add(key)
+
+        found = {}
+        for index, wanted in by_bucket.items():
+            for key in wanted:
+                found[key] = None
+            for item_key, item_value in self.table[index]:
+                if item_key in wanted:
+                    found[item_key] = item_value
+                    wanted.discard(item_key)
+                    if not wanted:
+                        break
+        return found
+
     def search_value(self, key, value):
         index = self.hash_function(key)
         for item in self.table[index]:
@@ -42,6 +68,63 @@ class HashTable:
                 return item[1]
         return None
 
+    def save(self, path):
+        """Writes the table as a binary snapshot, see algos.snapshot."""
+        groups = {}
+        for bucket in self.table:
+            for key, value in bucket:
+                groups.setdefault(key, []).append(value)
+        write_snapshot(path, list(groups.items()), HASH_TABLE, self.size)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Opens a snapshot written by save.
+
+        With mmap the returned MappedHashTable searches the file in place;
+        otherwise the file is read into a new HashTable.
+        """
+        index = MappedIndex(path, HASH_TABLE)
+        if mmap:
+            return MappedHashTable(index)
+        with index:
+            table = cls(index.buckets)
+            for key, values in index.groups():
+                for value in values:
+                    table.insert(key, value)
+        return table
+
+
+class MappedHashTable:
+    """Read-only HashTable served from a memory-mapped snapshot."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.index.close()
+
+    def search(self, key):
+        i = self.index.find(key)
+        if i < 0:
+            return None
+        return self.index.packed[self.index.value_starts[i]]
+
+    def search_value(self, key, value):
+        i = self.index.find(key)
+        if i >= 0 and value in self.index.values(i):
+            return value
+        return None
+
+    def search_many(self, keys):
+        return {key: self.search(key) for key in keys}
+
 
 # Подсчет числа коллизий хэш функц
 # ии и построение графика
@@ -0,0 +1,186 @@
+"""
+Vectorized quality analysis of hash functions for HashTable.
+
+The keys are converted once into NumPy matrices (code points for the
+polynomial hash, UTF-8 bytes for FNV-1a) and every hash function runs over
+all distinct keys column by column, so the cost grows with the key length,
+not with the number of keys. Sampled entries are mapped to buckets through
+the inverse index of np.unique, one fancy-indexing pass for any number.
+
+Hash functions:
+    - builtin: hash(key) % size, as HashTable.hash_function;
+    - polynomial: HashTable.hash_function_custom (p = 31);
+    - fnv1a: 64-bit FNV-1a of the UTF-8 bytes, modulo size;
+    - multiply_shift: 64-bit polynomial fold, multiplied by a random odd
+      constant; the high 32 bits are scaled to the size.
+
+For every function the report has the collisions (entries that land in an
+occupied bucket, as count_collisions), the longest chain and the
+chi-square statistic of the bucket loads against the uniform distribution
+with its normalized deviation z = (chi2 - dof) / sqrt(2 dof). Statistics
+are given for the sampled entries and for the distinct keys alone, since
+repeated keys collide under any hash function.
+
+Example usage:
+    >>> report = analyze(sample_keys(100000, seed=1), 1000)
+    >>> sorted(report)
+    ['builtin', 'fnv1a', 'multiply_shift', 'polynomial']
+"""
+
+import numpy as np
+
+from data.gen import generate_combinations
+
+METHODS = ["builtin", "polynomial", "fnv1a", "multiply_shift"]
+
+FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+FNV_PRIME = np.uint64(0x100000001B3)
+POLYNOMIAL_BASE = 31
+
+
+def sample_keys(count, seed=None, keys=None):
+    """
+    Draws count keys uniformly with replacement, like count_collisions.
+
+    Returns:
+        numpy.ndarray: The sampled keys as a unicode array.
+    """
+    keys = np.array(keys if keys is not None else generate_combinations())
+    rng = np.random.default_rng(seed)
+    return keys[rng.integers(0, len(keys), count)]
+
+
+def bucket_indices(keys, size, method, seed=0):
+    """
+    Computes the bucket of every key in one vectorized pass.
+
+    Args:
+        keys (numpy.ndarray): Unicode array of keys.
+        size (int): Number of buckets.
+        method (str): One of METHODS.
+        seed (int): Seed of the multiply-shift constant.
+
+    Returns:
+        numpy.ndarray: Bucket indices, int64.
+    """
+    unique, inverse = np.unique(keys, return_inverse=True)
+    return _unique_buckets(unique, size, method, seed)[inverse.ravel()]
+
+
+def bucket_stats(buckets, size):
+    """
+    Reduces bucket indices to collision and uniformity statistics.
+
+    Returns:
+        dict: entries, collisions, max_chain, chi2 and z.
+    """
+    n = len(buckets)
+    loads = np.bincount(buckets, minlength=size)
+    expected = n / size
+    chi2 = float(((loads - expected) ** 2).sum() / expected) if n else 0.0
+    dof = max(size - 1, 1)
+    return {
+        "entries": n,
+        "collisions": int(n - np.count_nonzero(loads)),
+        "max_chain": int(loads.max()) if size else 0,
+        "chi2": chi2,
+        "z": (chi2 - dof) / float(np.sqrt(2 * dof)),
+    }
+
+
+def analyze(keys, size, methods=METHODS, seed=0):
+    """
+    Analyzes every hash function on the keys for a table of size buckets.
+
+    Args:
+        keys (numpy.ndarray): Unicode array of sampled keys.
+        size (int): Number of buckets.
+        methods (list): Names from METHODS.
+        seed (int): Seed of the multiply-shift constant.
+
+    Returns:
+        dict: Method -> {"entries": stats, "keys": stats}, see bucket_stats.
+    """
+    unique, inverse = np.unique(keys, return_inverse=True)
+    report = {}
+    for method in methods:
+        per_key = _unique_buckets(unique, size, method, seed)
+        report[method] = {
+            "entries": bucket_stats(per_key[inverse.ravel()], size),
+            "keys": bucket_stats(per_key, size),
+        }
+    return report
+
+
+def _unique_buckets(keys, size, method, seed):
+    if method == "builtin":
+        # hash() строк не векторизуется, но ключей всего len(np.unique)
+        return np.fromiter((hash(key) % size for key in keys.tolist()), np.int64, len(keys))
+    if method == "polynomial":
+        return _polynomial(keys, size)
+    if method == "fnv1a":
+        return (_fnv1a(keys) % np.uint64(size)).astype(np.int64)
+    if method == "multiply_shift":
+        return _multiply_shift(keys, size, seed)
+    raise ValueError(f"Unknown hash method: {method}")
+
+
+def _code_points(keys):
+    # Матрица кодов символов, короткие ключи дополнены нулями
+    width = max(keys.dtype.itemsize // 4, 1)
+    codes = np.ascontiguousarray(keys, dtype=f"<U{width}").view(np.uint32)
+    return codes.reshape(len(keys), width).astype(np.int64)
+
+
+def _polynomial(keys, size):
+    codes = _code_points(keys)
+    hashes = np.zeros(len(keys), dtype=np.int64)
+    p_power = 1
+    for column in codes.T:
+        present = column != 0
+        step = (hashes + (column - ord("a") + 1) * p_power) % size
+        hashes = np.where(present, step, hashes)
+        p_power = p_power * POLYNOMIAL_BASE % size
+    return hashes
+
+
+def _fnv1a(keys):
+    encoded = np.array([key.encode("utf-8") for key in keys.tolist()], dtype=bytes)
+    width = max(encoded.dtype.itemsize, 1)
+    data = np.ascontiguousarray(encoded, dtype=f"S{width}").view(np.uint8)
+    data = data.reshape(len(keys), width).astype(np.uint64)
+    lengths = np.char.str_len(encoded)
+
+    hashes = np.full(len(keys), FNV_OFFSET, dtype=np.uint64)
+    for j, column in enumerate(data.T):
+        step = (hashes ^ column) * FNV_PRIME
+        hashes = np.where(j < lengths, step, hashes)
+    return hashes
+
+
+def _multiply_shift(keys, size, seed):
+    codes = _code_points(keys).astype(np.uint64)
+    folded = np.zeros(len(keys), dtype=np.uint64)
+    for column in codes.T:
+        present = column != 0
+        folded = np.where(present, folded * np.uint64(POLYNOMIAL_BASE) + column, folded)
+
+    rng = np.random.default_rng(seed)
+    a = np.uint64(int(rng.integers(0, 1 << 63)) << 1 | 1)
+    high = (folded * a) >> np.uint64(32)
+    return ((high * np.uint64(size)) >> np.uint64(32)).astype(np.int64)
+
+
+def run_analysis(sizes, methods=METHODS, seed=0):
+    """
+    Analyzes the hash functions for tables of every size.
+
+    As in count_collisions, a table of size buckets gets size sampled keys.
+
+    Returns:
+        dict: Size -> report of analyze.
+    """
+    return {
+        size: analyze(sample_keys(size, seed), size, methods, seed)
+        for size in sizes
+    }
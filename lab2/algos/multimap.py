@@ -1,4 +1,8 @@
+import string
 from collections import defaultdict
+from collections.abc import Set
+
+from .snapshot import MULTIMAP, MappedIndex, write_snapshot
 
 
 class MultiMap:
@@ -9,4 +13,221 @@ class MultiMap:
         self.multi_map[key].add(value)
 
     def search(self, key):
-        return self.multi_map[key]
+        # get, а не [], чтобы поиск не создавал пустые множества
+        return self.multi_map.get(key, set())
+
+    def search_many(self, keys):
+        return {key: self.multi_map.get(key, set()) for key in keys}
+
+    def save(self, path):
+        """Writes the map as a binary snapshot, see algos.snapshot."""
+        groups = [(key, sorted(values)) for key, values in self.multi_map.items()]
+        write_snapshot(path, groups, MULTIMAP)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Opens a snapshot written by save.
+
+        With mmap the returned MappedMultiMap searches the file in place;
+        otherwise the file is read into a new MultiMap.
+        """
+        index = MappedIndex(path, MULTIMAP)
+        if mmap:
+            return MappedMultiMap(index)
+        multimap = cls()
+        with index:
+            for key, values in index.groups():
+                multimap.multi_map[key] = set(values)
+        return multimap
+
+
+class MappedMultiMap:
+    """Read-only MultiMap served from a memory-mapped snapshot."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.index.close()
+
+    def search(self, key):
+        i = self.index.find(key)
+        return set() if i < 0 else set(self.index.values(i))
+
+    def search_many(self, keys):
+        return {key: self.search(key) for key in keys}
+
+
+LETTERS = string.ascii_lowercase
+TWO_LETTER_KEYS = len(LETTERS) ** 2
+
+
+def two_letter_index(key):
+    """Direct index of a two-letter lowercase key, 0..675, or -1, without hashing."""
+    if len(key) == 2:
+        i = ord(key[0]) - 97
+        j = ord(key[1]) - 97
+        if 0 <= i < 26 and 0 <= j < 26:
+            return i * 26 + j
+    return -1
+
+
+class BitSet(Set):
+    """
+    Set of small non-negative ints stored as an int bitmask.
+
+    Only DirectMultiMap changes the mask; to everyone else it is a read-only
+    view that follows later inserts, like the set of MultiMap.search.
+
+    Supports in, iteration, len and comparisons with ordinary sets; & and |
+    between two BitSets are single big-int operations.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __contains__(self, value):
+        return type(value) is int and value >= 0 and self.mask >> value & 1 == 1
+
+    def __iter__(self):
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def __len__(self):
+        return self.mask.bit_count()
+
+    def __repr__(self):
+        return f"BitSet({set(self)})"
+
+    def __and__(self, other):
+        if isinstance(other, BitSet):
+            return BitSet(self.mask & other.mask)
+        return Set.__and__(self, other)
+
+    def __or__(self, other):
+        if isinstance(other, BitSet):
+            return BitSet(self.mask | other.mask)
+        return Set.__or__(self, other)
+
+    @classmethod
+    def _from_iterable(cls, values):
+        mask = 0
+        for value in values:
+            mask |= 1 << value
+        return cls(mask)
+
+
+# Результат поиска отсутствующего ключа, никогда не изменяется
+EMPTY = BitSet()
+
+
+class DirectMultiMap:
+    """
+    MultiMap over a closed key universe with small integer values.
+
+    The values of every key of the universe are one int bitmask, value v is
+    bit v, held by a BitSet allocated up front, so nothing grows or
+    rehashes. Two-letter lowercase keys, the whole default universe, are
+    indexed arithmetically in a list of 676 rows with no string hashing;
+    other keys of a declared universe go through a dict built once. search
+    returns the stored BitSet itself, and unions and intersections across
+    keys are big-int | and &.
+
+    Values are non-negative ints; a mask takes max(value) / 8 bytes.
+
+    Args:
+        keys (list): The key universe, the 676 two-letter keys by default.
+    """
+
+    def __init__(self, keys=None):
+        if keys is None:
+            keys = [a + b for a in LETTERS for b in LETTERS]
+        self.keys = list(keys)
+        # Строка None - двухбуквенный ключ вне вселенной
+        self.rows = [None] * TWO_LETTER_KEYS
+        self.others = {}
+        for key in self.keys:
+            i = two_letter_index(key)
+            if i >= 0:
+                self.rows[i] = BitSet()
+            else:
+                self.others[key] = BitSet()
+
+    def __len__(self):
+        return sum(len(row) for row in self.rows if row is not None) + sum(
+            len(row) for row in self.others.values()
+        )
+
+    def _row(self, key):
+        # Вызов two_letter_index стоит дороже самого индекса, поэтому
+        # горячие методы повторяют его у себя
+        if len(key) == 2:
+            i = ord(key[0]) - 97
+            j = ord(key[1]) - 97
+            if 0 <= i < 26 and 0 <= j < 26:
+                return self.rows[i * 26 + j]
+        return self.others.get(key)
+
+    def insert(self, key, value):
+        # Отрицательное значение дает ValueError на сдвиге, чужой ключ - KeyError
+        if len(key) == 2:
+            i = ord(key[0]) - 97
+            j = ord(key[1]) - 97
+            if 0 <= i < 26 and 0 <= j < 26:
+                row = self.rows[i * 26 + j]
+                if row is None:
+                    raise KeyError(key)
+                row.mask |= 1 << value
+                return
+        self.others[key].mask |= 1 << value
+
+    def contains(self, key, value):
+        row = self._row(key)
+        return row is not None and value >= 0 and row.mask >> value & 1 == 1
+
+    def mask(self, key):
+        """Returns the values of the key as an int bitmask, 0 if none."""
+        row = self._row(key)
+        return 0 if row is None else row.mask
+
+    def search(self, key):
+        # Живое представление, как множество в MultiMap.search
+        if len(key) == 2:
+            i = ord(key[0]) - 97
+            j = ord(key[1]) - 97
+            if 0 <= i < 26 and 0 <= j < 26:
+                row = self.rows[i * 26 + j]
+                return EMPTY if row is None else row
+        return self.others.get(key, EMPTY)
+
+    def search_many(self, keys):
+        return {key: self.search(key) for key in keys}
+
+    def union(self, keys):
+        """Values stored under any of the keys."""
+        result = 0
+        for key in keys:
+            result |= self.mask(key)
+        return BitSet(result)
+
+    def intersection(self, keys):
+        """Values stored under every one of the keys."""
+        result = None
+        for key in keys:
+            mask = self.mask(key)
+            result = mask if result is None else result & mask
+            if not result:
+                break
+        return BitSet(result or 0)
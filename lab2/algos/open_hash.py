@@ -0,0 +1,180 @@
+MIN_CAPACITY = 8
+MAX_LOAD = 0.85
+MIN_LOAD = 0.2
+
+
+# Хэш таблица с открытой адресацией (Robin Hood)
+class OpenHashTable:
+    """
+    Drop-in replacement for HashTable built on open addressing.
+
+    Every distinct key takes one slot of three flat lists (cached hash, key,
+    values), so there are no per-bucket lists of tuples and a lookup
+    compares cached hashes before keys. Robin Hood probing keeps probe
+    sequences short and lets a failed lookup stop early. The capacity is a
+    power of two that doubles above MAX_LOAD and halves below MIN_LOAD.
+    Deletion shifts the following entries back, so no tombstones are left.
+
+    Like HashTable, the same key may be inserted several times: search
+    returns the first inserted value and search_value checks for a pair.
+    """
+
+    def __init__(self, size=MIN_CAPACITY):
+        capacity = MIN_CAPACITY
+        while capacity * MAX_LOAD < size:
+            capacity *= 2
+        self._allocate(capacity)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self._find(key, hash(key)) >= 0
+
+    @property
+    def capacity(self):
+        return self.mask + 1
+
+    @property
+    def load_factor(self):
+        return self.used / self.capacity
+
+    def insert(self, key, value):
+        h = hash(key)
+        i = self._find(key, h)
+        if i >= 0:
+            self.values[i].append(value)
+        else:
+            if self.used + 1 > self.capacity * MAX_LOAD:
+                self._resize(self.capacity * 2)
+            self._place(h, key, [value])
+            self.used += 1
+        self.count += 1
+
+    def search(self, key):
+        i = self._find(key, hash(key))
+        if i < 0:
+            return None
+        return self.values[i][0]
+
+    def search_many(self, keys):
+        """Returns a dict key -> first inserted value or None, like search."""
+        find = self._find
+        values = self.values
+        found = {}
+        for key in keys:
+            i = find(key, hash(key))
+            found[key] = None if i < 0 else values[i][0]
+        return found
+
+    def search_value(self, key, value):
+        i = self._find(key, hash(key))
+        if i >= 0 and value in self.values[i]:
+            return value
+        return None
+
+    def search_all(self, key):
+        i = self._find(key, hash(key))
+        return [] if i < 0 else list(self.values[i])
+
+    def delete(self, key):
+        """Removes the key with all its values and returns the values."""
+        i = self._find(key, hash(key))
+        if i < 0:
+            raise KeyError(key)
+        values = self.values[i]
+        self._remove_slot(i)
+        self.count -= len(values)
+        return values
+
+    def remove(self, key, value):
+        """Removes one (key, value) pair."""
+        i = self._find(key, hash(key))
+        if i < 0:
+            raise KeyError(key)
+        values = self.values[i]
+        values.remove(value)
+        self.count -= 1
+        if not values:
+            self._remove_slot(i)
+
+    def _allocate(self, capacity):
+        self.mask = capacity - 1
+        self.hashes = [None] * capacity
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        self.used = 0
+
+    def _find(self, key, h):
+        hashes = self.hashes
+        mask = self.mask
+        i = h & mask
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash is None:
+                return -1
+            # Robin Hood: дальше ключа быть не может
+            if (i - slot_hash) & mask < dist:
+                return -1
+            if slot_hash == h:
+                slot_key = self.keys[i]
+                if slot_key is key or slot_key == key:
+                    return i
+            i = (i + 1) & mask
+            dist += 1
+
+    def _place(self, h, key, values):
+        hashes = self.hashes
+        keys = self.keys
+        slots = self.values
+        mask = self.mask
+        i = h & mask
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash is None:
+                hashes[i] = h
+                keys[i] = key
+                slots[i] = values
+                return
+            slot_dist = (i - slot_hash) & mask
+            if slot_dist < dist:
+                # Забираем место у более "богатого" элемента
+                hashes[i], h = h, slot_hash
+                keys[i], key = key, keys[i]
+                slots[i], values = values, slots[i]
+                dist = slot_dist
+            i = (i + 1) & mask
+            dist += 1
+
+    def _remove_slot(self, i):
+        hashes = self.hashes
+        keys = self.keys
+        slots = self.values
+        mask = self.mask
+        # Сдвиг назад вместо надгробий
+        j = (i + 1) & mask
+        while hashes[j] is not None and (j - hashes[j]) & mask != 0:
+            hashes[i] = hashes[j]
+            keys[i] = keys[j]
+            slots[i] = slots[j]
+            i = j
+            j = (j + 1) & mask
+        hashes[i] = keys[i] = slots[i] = None
+        self.used -= 1
+
+        if self.capacity > MIN_CAPACITY and self.used < self.capacity * MIN_LOAD:
+            self._resize(self.capacity // 2)
+
+    def _resize(self, capacity):
+        entries = [
+            (h, k, v)
+            for h, k, v in zip(self.hashes, self.keys, self.values)
+            if h is not None
+        ]
+        self._allocate(capacity)
+        for h, k, v in entries:
+            self._place(h, k, v)
+        self.used = len(entries)
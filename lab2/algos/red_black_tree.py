@@ -1,10 +1,22 @@
+from .bulk import find_many, group_items, merge_groups, rebuild_pays_off
+
+RED = True
+BLACK = False
+
+
 class Node:
+    # __slots__ убирает __dict__ у каждого узла
+    __slots__ = ("key", "values", "color", "left", "right", "parent", "count")
+
     def __init__(
-        self, key, data, color="red", left=None, right=None, parent=None
+        self, key, values, color=RED, left=None, right=None, parent=None
     ):
         self.key = key
-        self.data = data
+        # Все значения с одинаковым ключом хранятся в одном узле
+        self.values = values
         self.color = color
+        # Число значений в поддереве, у NIL - 0
+        self.count = len(values)
         self.left = left
         self.right = right
         self.parent = parent
@@ -12,114 +24,291 @@ class Node:
 
 class RedBlackTree:
     def __init__(self):
-        self.NIL = Node(key=None, data=None, color="black")
+        self.NIL = Node(key=None, values=[], color=BLACK)
         self.root = self.NIL
+        # Число узлов, то есть различных ключей
+        self.size = 0
+
+    def __len__(self):
+        """Number of stored (key, value) pairs."""
+        return self.root.count
+
+    def __iter__(self):
+        """Yields all (key, value) pairs in key order."""
+        return self.range()
+
+    @classmethod
+    def from_items(cls, items, presorted=False):
+        """
+        Builds a balanced red-black tree from (key, value) pairs in O(n).
+
+        The pairs are sorted once, unless presorted is set. All levels but
+        the last are full; the last incomplete level is red and the rest is
+        black, so every path has the same number of black nodes.
+        """
+        tree = cls()
+        tree._rebuild(group_items(items, presorted))
+        return tree
+
+    bulk_load = from_items
+
+    def bulk_insert(self, items, presorted=False):
+        """
+        Inserts a batch of (key, value) pairs.
+
+        A large batch is merged with the in-order contents of the tree and
+        the tree is rebuilt in O(n + m); a small one is inserted pair by
+        pair.
+        """
+        batch = group_items(items, presorted)
+        if rebuild_pays_off(self.size, len(batch)):
+            old = [(node.key, node.values) for node in self._inorder_nodes()]
+            self._rebuild(merge_groups(old, batch))
+            return
+        for key, values in batch:
+            for value in values:
+                self.insert(key, value)
 
     def insert(self, key, data):
-        new_node = Node(
-            key,
-            data,
-            color="red",
-            left=self.NIL,
-            right=self.NIL,
-            parent=self.NIL,
-        )
+        nil = self.NIL
         parent = None
         current = self.root
-        while current != self.NIL:
+        while current is not nil:
             parent = current
+            # Новое значение попадет в поддерево каждого узла на пути
+            current.count += 1
             if key < current.key:
                 current = current.left
-            else:
+            elif current.key < key:
                 current = current.right
-        new_node.parent = parent
+            else:
+                current.values.append(data)
+                return
+
+        new_node = Node(key, [data], RED, nil, nil, parent)
+        self.size += 1
         if parent is None:
             self.root = new_node
+        elif key < parent.key:
+            parent.left = new_node
         else:
-            if new_node.key < parent.key:
-                parent.left = new_node
-            else:
-                parent.right = new_node
-        new_node.color = "red"
+            parent.right = new_node
         self.fix_insert(new_node)
 
     def fix_insert(self, node):
-        while node != self.root and node.parent.color == "red":
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == "red":
-                    node.parent.color = uncle.color = "black"
-                    node.parent.parent.color = "red"
-                    node = node.parent.parent
+        # Сравнения узлов только по идентичности, цвет - bool
+        while node is not self.root and node.parent.color is RED:
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if uncle.color is RED:
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
                 else:
-                    if node == node.parent.right:
-                        node = node.parent
+                    if node is parent.right:
+                        node = parent
                         self.left_rotate(node)
-                    node.parent.color = "black"
-                    node.parent.parent.color = "red"
-                    self.right_rotate(node.parent.parent)
+                        parent = node.parent
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self.right_rotate(grandparent)
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == "red":
-                    node.parent.color = uncle.color = "black"
-                    node.parent.parent.color = "red"
-                    node = node.parent.parent
+                uncle = grandparent.left
+                if uncle.color is RED:
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
                 else:
-                    if node == node.parent.left:
-                        node = node.parent
+                    if node is parent.left:
+                        node = parent
                         self.right_rotate(node)
-                    node.parent.color = "black"
-                    node.parent.parent.color = "red"
-                    self.left_rotate(node.parent.parent)
-            if node == self.root:
-                break
-        self.root.color = "black"
+                        parent = node.parent
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self.left_rotate(grandparent)
+        self.root.color = BLACK
 
     def left_rotate(self, x):
         y = x.right
         x.right = y.left
-        if y.left != self.NIL:
+        if y.left is not self.NIL:
             y.left.parent = x
         y.parent = x.parent
         if x.parent is None:
             self.root = y
+        elif x is x.parent.left:
+            x.parent.left = y
         else:
-            if x == x.parent.left:
-                x.parent.left = y
-            else:
-                x.parent.right = y
+            x.parent.right = y
         y.left = x
         x.parent = y
+        y.count = x.count
+        x.count = len(x.values) + x.left.count + x.right.count
 
     def right_rotate(self, x):
         y = x.left
         x.left = y.right
-        if y.right != self.NIL:
+        if y.right is not self.NIL:
             y.right.parent = x
         y.parent = x.parent
         if x.parent is None:
             self.root = y
+        elif x is x.parent.right:
+            x.parent.right = y
         else:
-            if x == x.parent.right:
-                x.parent.right = y
-            else:
-                x.parent.left = y
+            x.parent.left = y
         y.right = x
         x.parent = y
+        y.count = x.count
+        x.count = len(x.values) + x.left.count + x.right.count
 
     def search(self, key):
-        return self._search_tree(self.root, key)
-
-    def _search_tree(self, node, key):
-        if node == self.NIL:
-            return []
-        elif key == node.key:
-            return (
-                [node.data]
-                + self._search_tree(node.left, key)
-                + self._search_tree(node.right, key)
-            )
-        elif key < node.key:
-            return self._search_tree(node.left, key)
-        else:
-            return self._search_tree(node.right, key)
+        node = self._find(key)
+        return [] if node is self.NIL else list(node.values)
+
+    def search_many(self, keys):
+        """
+        Looks up a batch of keys in one merged traversal of the tree.
+
+        Returns:
+            dict: Key -> list of its values, as returned by search.
+        """
+        nil = self.NIL
+        return {
+            key: [] if node is nil else list(node.values)
+            for key, node in find_many(self.root, nil, sorted(set(keys)))
+        }
+
+    def _find(self, key):
+        nil = self.NIL
+        node = self.root
+        while node is not nil:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return nil
+
+    def rank(self, key):
+        """Returns the number of pairs whose key is less than key."""
+        return self._rank(key, inclusive=False)
+
+    def select(self, i):
+        """
+        Returns the i-th (key, value) pair in key order, counting from 0.
+
+        Values of one key keep their insertion order. Negative indexes count
+        from the end, as for lists.
+        """
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("tree index out of range")
+        node = self.root
+        while True:
+            left = node.left.count
+            if i < left:
+                node = node.left
+                continue
+            i -= left
+            if i < len(node.values):
+                return node.key, node.values[i]
+            i -= len(node.values)
+            node = node.right
+
+    def percentile(self, q):
+        """Returns the pair at fraction q (0 <= q <= 1) of the key order."""
+        if not 0 <= q <= 1:
+            raise ValueError("percentile must be between 0 and 1")
+        return self.select(round(q * (len(self) - 1)))
+
+    def count_range(self, lo, hi):
+        """Returns the number of pairs with lo <= key <= hi."""
+        if hi < lo:
+            return 0
+        return self._rank(hi, inclusive=True) - self._rank(lo, inclusive=False)
+
+    def range(self, lo=None, hi=None):
+        """
+        Yields the (key, value) pairs with lo <= key <= hi in key order.
+
+        A bound of None is open. The traversal keeps only the path from the
+        root on an explicit stack and skips subtrees outside the bounds.
+        """
+        nil = self.NIL
+        stack = []
+        node = self.root
+        while stack or node is not nil:
+            while node is not nil:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and hi < node.key:
+                return
+            for value in node.values:
+                yield node.key, value
+            node = node.right
+
+    def keys(self):
+        """Yields the distinct keys in order."""
+        for node in self._inorder_nodes():
+            yield node.key
+
+    def _rank(self, key, inclusive):
+        nil = self.NIL
+        rank = 0
+        node = self.root
+        while node is not nil:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                rank += node.left.count + len(node.values)
+                node = node.right
+            else:
+                rank += node.left.count
+                if inclusive:
+                    rank += len(node.values)
+                return rank
+        return rank
+
+    def _inorder_nodes(self):
+        nil = self.NIL
+        stack = []
+        node = self.root
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def _rebuild(self, groups):
+        n = len(groups)
+        # Уровень, на котором дерево может быть неполным
+        red_depth = n.bit_length() - 1
+        self.root = self._build(groups, 0, n, None, 0, red_depth or -1)
+        self.root.color = BLACK
+        self.size = n
+
+    def _build(self, groups, lo, hi, parent, depth, red_depth):
+        if lo >= hi:
+            return self.NIL
+        mid = (lo + hi) // 2
+        key, values = groups[mid]
+        color = RED if depth == red_depth else BLACK
+        node = Node(key, values, color, parent=parent)
+        node.left = self._build(groups, lo, mid, node, depth + 1, red_depth)
+        node.right = self._build(groups, mid + 1, hi, node, depth + 1, red_depth)
+        node.count += node.left.count + node.right.count
+        return node
@@ -0,0 +1,183 @@
+"""
+Binary snapshots of key -> values indexes with memory-mapped lookups.
+
+The file is laid out so that it can be searched in place:
+
+    header         magic, version, kind, buckets, keys, values
+    bucket_starts  uint64[buckets + 1]: first key id of every bucket
+    key_offsets    uint64[keys + 1]: UTF-8 key bytes in the key table
+    value_starts   uint64[keys + 1]: first value of every key
+    values         int64[values]: the values of all keys, packed
+    key table      UTF-8 bytes of all keys, each stored once
+
+All numbers are little-endian. A key lives in bucket crc32(key) % buckets,
+which, unlike hash(), is the same in every process. MappedIndex maps the
+file read-only and answers lookups straight from the mapping, so opening a
+snapshot costs a header parse and processes share the pages of one file.
+
+Example usage:
+    >>> write_snapshot("index.bin", [("ab", [1, 2]), ("cd", [3])], MULTIMAP)
+    >>> with MappedIndex("index.bin", MULTIMAP) as index:
+    ...     index.values(index.find("ab")).tolist()
+    [1, 2]
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from zlib import crc32
+
+MAGIC = b"HMAP"
+VERSION = 1
+HEADER = struct.Struct("<4sHBxQQQ")
+
+# Тип структуры, сохраненной в файле
+HASH_TABLE = 0
+MULTIMAP = 1
+
+
+def write_snapshot(path, groups, kind, buckets=None):
+    """
+    Writes (key, values) groups as a snapshot, atomically replacing a file.
+
+    Args:
+        path (str): The snapshot file.
+        groups (list): Pairs (str key, list of int values), keys distinct.
+        kind (int): HASH_TABLE or MULTIMAP.
+        buckets (int): Number of buckets, the number of keys by default.
+
+    Raises:
+        TypeError: If a value is not an integer.
+        OverflowError: If a value does not fit into int64.
+    """
+    buckets = max(buckets or len(groups), 1)
+    by_bucket = [[] for _ in range(buckets)]
+    for key, values in groups:
+        encoded = key.encode("utf-8")
+        by_bucket[crc32(encoded) % buckets].append((encoded, values))
+
+    bucket_starts = array("Q", [0])
+    key_offsets = array("Q", [0])
+    value_starts = array("Q", [0])
+    packed = array("q")
+    key_table = bytearray()
+    for bucket in by_bucket:
+        for encoded, values in bucket:
+            key_table += encoded
+            key_offsets.append(len(key_table))
+            packed.extend(values)
+            value_starts.append(len(packed))
+        bucket_starts.append(len(key_offsets) - 1)
+
+    arrays = [bucket_starts, key_offsets, value_starts, packed]
+    if sys.byteorder == "big":
+        for numbers in arrays:
+            numbers.byteswap()
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(
+            HEADER.pack(MAGIC, VERSION, kind, buckets, len(key_offsets) - 1, len(packed))
+        )
+        for numbers in arrays:
+            numbers.tofile(file)
+        file.write(key_table)
+    os.replace(tmp_path, path)
+
+
+class MappedIndex:
+    """
+    Read-only view of a snapshot file.
+
+    Keys are addressed by their id, the position in the key table; find
+    returns the id of a key or -1. The arrays are memoryviews of the
+    mapping, so nothing is read from the file until a lookup touches it.
+    """
+
+    def __init__(self, path, kind):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse(kind)
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _parse(self, kind):
+        magic, version, file_kind, buckets, keys, values = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an index snapshot")
+        if file_kind != kind:
+            raise ValueError(f"Snapshot holds kind {file_kind}, expected {kind}")
+
+        self.buckets = buckets
+        self._views = []
+        offset = HEADER.size
+        self.bucket_starts, offset = self._array("Q", offset, buckets + 1)
+        self.key_offsets, offset = self._array("Q", offset, keys + 1)
+        self.value_starts, offset = self._array("Q", offset, keys + 1)
+        self.packed, offset = self._array("q", offset, values)
+
+        end = offset + self.key_offsets[keys]
+        if end != len(self._mmap):
+            raise ValueError("Truncated index snapshot")
+        self.key_table = self._view(offset, end)
+
+    def _view(self, start, end):
+        view = memoryview(self._mmap)[start:end]
+        self._views.append(view)
+        return view
+
+    def _array(self, typecode, offset, count):
+        end = offset + count * 8
+        if end > len(self._mmap):
+            raise ValueError("Truncated index snapshot")
+        if sys.byteorder == "big":
+            # На big-endian данные приходится копировать
+            numbers = array(typecode, self._mmap[offset:end])
+            numbers.byteswap()
+            return numbers, end
+        view = self._view(offset, end).cast(typecode)
+        self._views.append(view)
+        return view, end
+
+    def __len__(self):
+        return len(self.key_offsets) - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # memoryview должны быть освобождены до закрытия mmap
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def find(self, key):
+        encoded = key.encode("utf-8")
+        bucket = crc32(encoded) % self.buckets
+        offsets = self.key_offsets
+        key_table = self.key_table
+        for i in range(self.bucket_starts[bucket], self.bucket_starts[bucket + 1]):
+            start, end = offsets[i], offsets[i + 1]
+            if end - start == len(encoded) and key_table[start:end] == encoded:
+                return i
+        return -1
+
+    def key(self, i):
+        return str(self.key_table[self.key_offsets[i]:self.key_offsets[i + 1]], "utf-8")
+
+    def values(self, i):
+        """Returns the packed values of key i, without copying them."""
+        return self.packed[self.value_starts[i]:self.value_starts[i + 1]]
+
+    def groups(self):
+        """Yields (key, list of values) for every key."""
+        for i in range(len(self)):
+            yield self.key(i), self.values(i).tolist()
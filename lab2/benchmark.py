@@ -0,0 +1,442 @@
+"""
+Reproducible benchmark of the lab2 search structures.
+
+For every structure and size the benchmark measures:
+    - build throughput: pairs inserted one by one per second;
+    - search latency: percentiles over thousands of single-key searches
+      with a given share of hits, timed with perf_counter_ns;
+    - search throughput: the same queries in one untimed-per-query loop;
+    - memory per entry: bytes allocated by the build, from tracemalloc.
+
+Builds insert the pairs one by one; with --bulk the trees that have a
+from_items bulk loader (BULK_BUILDERS) are built with it instead.
+
+With --contention it also measures the throughput of ConcurrentHashTable
+under a mixed read/write load as the number of threads grows, next to a
+single-shard (single-lock) table.
+
+All structures get the same seeded pairs and the same queries. Missing
+keys are three-letter strings, so they fall between the stored two-letter
+keys instead of all landing at one end of a tree.
+
+Example usage:
+    $ python benchmark.py --sizes 1000 10000 100000 --output bench.json --plot bench.png
+    $ python benchmark.py --sizes 10000 --contention --threads 1 2 4 8
+    $ python benchmark.py --structures binary_tree red_black_tree b_plus_tree --bulk
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import string
+import sys
+import threading
+import time
+import tracemalloc
+
+from algos.b_tree import BPlusTree
+from algos.bin_tree import BinarySearchTree
+from algos.concurrent import DEFAULT_SHARDS, ConcurrentHashTable
+from algos.hash import HashTable
+from algos.multimap import DirectMultiMap, MultiMap
+from algos.open_hash import OpenHashTable
+from algos.red_black_tree import RedBlackTree
+from data.gen import generate_combinations
+
+# Фабрики пустых структур по ожидаемому числу пар
+STRUCTURES = {
+    "binary_tree": lambda size: BinarySearchTree(),
+    "red_black_tree": lambda size: RedBlackTree(),
+    "b_plus_tree": lambda size: BPlusTree(),
+    "hash_table": HashTable,
+    "open_hash_table": OpenHashTable,
+    "multimap": lambda size: MultiMap(),
+    "direct_multimap": lambda size: DirectMultiMap(),
+    "concurrent_hash_table": ConcurrentHashTable,
+}
+# Построение из массива пар: одна сортировка и сборка за O(n), см. algos.bulk
+BULK_BUILDERS = {
+    "binary_tree": BinarySearchTree.from_items,
+    "red_black_tree": RedBlackTree.from_items,
+    "b_plus_tree": BPlusTree.from_items,
+}
+SIZES = [1000, 10000, 100000]
+THREADS = [1, 2, 4, 8]
+PERCENTILES = [50, 90, 99]
+
+
+def make_items(size, seed=0):
+    """
+    Builds seeded (key, value) pairs over the two-letter keys.
+
+    Returns:
+        list: size pairs (key, value).
+    """
+    rng = random.Random(f"{seed}-items-{size}")
+    keys = generate_combinations()
+    return [(rng.choice(keys), rng.randint(1, 100)) for _ in range(size)]
+
+
+def make_queries(items, count, hit_ratio=0.5, seed=0):
+    """
+    Builds seeded search keys with the given share of stored keys.
+
+    Args:
+        items (list): The stored pairs.
+        count (int): Number of queries.
+        hit_ratio (float): Share of queries for stored keys.
+        seed (int): Seed of the generator.
+
+    Returns:
+        list: The keys to search, in random order.
+    """
+    rng = random.Random(f"{seed}-queries-{len(items)}-{hit_ratio}")
+    stored = sorted({key for key, _ in items})
+    hits = round(count * hit_ratio)
+    queries = [rng.choice(stored) for _ in range(hits)]
+    # Трехбуквенных ключей в структурах нет
+    queries += [
+        rng.choice(stored) + rng.choice(string.ascii_lowercase)
+        for _ in range(count - hits)
+    ]
+    rng.shuffle(queries)
+    return queries
+
+
+def build(factory, items, bulk=None):
+    if bulk is not None:
+        return bulk(items)
+    structure = factory(len(items))
+    for key, value in items:
+        structure.insert(key, value)
+    return structure
+
+
+def time_build(factory, items, repeats=3, warmup=1, bulk=None):
+    """Returns durations of full builds in nanoseconds."""
+    for _ in range(warmup):
+        build(factory, items, bulk)
+
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter_ns()
+        build(factory, items, bulk)
+        times.append(time.perf_counter_ns() - start_time)
+    return times
+
+
+def time_searches(structure, queries, warmup=1):
+    """
+    Times every search separately.
+
+    The cost of reading the clock twice is measured first and subtracted,
+    so the latencies are not dominated by the timer.
+
+    Returns:
+        list: Latencies of the searches in nanoseconds.
+    """
+    search = structure.search
+    clock = time.perf_counter_ns
+    for _ in range(warmup):
+        for key in queries:
+            search(key)
+
+    overhead = min(-clock() + clock() for _ in range(1000))
+    latencies = []
+    for key in queries:
+        start_time = clock()
+        search(key)
+        latencies.append(max(clock() - start_time - overhead, 0))
+    return latencies
+
+
+def time_search_loop(structure, queries, repeats=3):
+    """Returns the best duration of searching all queries in nanoseconds."""
+    search = structure.search
+    best = None
+    for _ in range(repeats):
+        start_time = time.perf_counter_ns()
+        for key in queries:
+            search(key)
+        elapsed = time.perf_counter_ns() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_memory(factory, items, bulk=None):
+    """Returns the bytes allocated by a build and still held by it."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(factory, items, bulk)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return after - before
+
+
+def percentile(ordered, p):
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+def run_benchmark(
+    structures=None,
+    sizes=SIZES,
+    queries=10000,
+    hit_ratios=(1.0, 0.5, 0.0),
+    repeats=3,
+    warmup=1,
+    seed=0,
+    bulk=False,
+    log=print,
+):
+    """
+    Benchmarks every structure on every size and hit ratio.
+
+    Args:
+        structures (list): Names from STRUCTURES. Defaults to all of them.
+        sizes (list): Numbers of stored pairs.
+        queries (int): Searches per hit ratio.
+        hit_ratios (list): Shares of searches for stored keys.
+        repeats (int): Timed builds and search loops per case.
+        warmup (int): Untimed builds and search passes per case.
+        seed (int): Seed of the pairs and the queries.
+        bulk (bool): Whether to build the structures of BULK_BUILDERS with
+            their bulk loader instead of one insert per pair.
+        log (callable): Receives one line per finished case.
+
+    Returns:
+        dict: JSON-serializable results with a "meta" and a "results" part.
+    """
+    structures = structures or list(STRUCTURES)
+    results = []
+
+    for size in sizes:
+        items = make_items(size, seed)
+        workloads = {
+            ratio: make_queries(items, queries, ratio, seed) for ratio in hit_ratios
+        }
+        for name in structures:
+            factory = STRUCTURES[name]
+            loader = BULK_BUILDERS.get(name) if bulk else None
+            build_times = time_build(factory, items, repeats, warmup, loader)
+            memory = measure_memory(factory, items, loader)
+            structure = build(factory, items, loader)
+
+            result = {
+                "structure": name,
+                "size": size,
+                "build": "insert" if loader is None else "bulk",
+                "build_median_ns": statistics.median(build_times),
+                "build_per_second": size / (min(build_times) / 1e9),
+                "memory_bytes": memory,
+                "bytes_per_entry": memory / size,
+                "search": [],
+            }
+            for ratio, workload in workloads.items():
+                ordered = sorted(time_searches(structure, workload, warmup))
+                loop_ns = time_search_loop(structure, workload, repeats)
+                result["search"].append({
+                    "hit_ratio": ratio,
+                    "queries": len(workload),
+                    **{f"p{p}_ns": percentile(ordered, p) for p in PERCENTILES},
+                    "mean_ns": statistics.fmean(ordered),
+                    "per_second": len(workload) / (loop_ns / 1e9),
+                })
+            results.append(result)
+
+            first = result["search"][0]
+            log(
+                f"{name} {size}: {result['build']} build {result['build_per_second']:.0f}/s, "
+                f"search p50 {first['p50_ns']} ns, "
+                f"{result['bytes_per_entry']:.1f} B/entry"
+            )
+
+    return {
+        "meta": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "queries": queries,
+            "repeats": repeats,
+            "warmup": warmup,
+            "bulk": bulk,
+        },
+        "results": results,
+    }
+
+
+def run_contention(
+    size=100000,
+    threads=THREADS,
+    operations=200000,
+    read_ratio=0.9,
+    shards=(1, DEFAULT_SHARDS),
+    seed=0,
+    log=print,
+):
+    """
+    Measures ConcurrentHashTable throughput as the number of threads grows.
+
+    The operations are split evenly between the threads, and all threads
+    start together on a barrier, so the time is the wall time of the whole
+    mixed load.
+
+    Args:
+        size (int): Pairs inserted before the measurement.
+        threads (list): Thread counts.
+        operations (int): Total searches and inserts per case.
+        read_ratio (float): Share of searches among the operations.
+        shards (list): Shard counts; 1 is a table behind one lock.
+        seed (int): Seed of the pairs and the operations.
+        log (callable): Receives one line per finished case.
+
+    Returns:
+        list: JSON-serializable results, one per (shards, threads).
+    """
+    items = make_items(size, seed)
+    results = []
+    for shard_count in shards:
+        for thread_count in threads:
+            table = ConcurrentHashTable(size, shard_count)
+            table.insert_many(items)
+            workloads = [
+                _contention_workload(items, operations // thread_count, read_ratio, f"{seed}-{t}")
+                for t in range(thread_count)
+            ]
+            barrier = threading.Barrier(thread_count + 1)
+            workers = [
+                threading.Thread(target=_run_operations, args=(table, workload, barrier))
+                for workload in workloads
+            ]
+            for worker in workers:
+                worker.start()
+            barrier.wait()
+            start_time = time.perf_counter_ns()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter_ns() - start_time
+
+            done = sum(len(workload) for workload in workloads)
+            results.append({
+                "shards": shard_count,
+                "threads": thread_count,
+                "operations": done,
+                "read_ratio": read_ratio,
+                "elapsed_ns": elapsed,
+                "per_second": done / (elapsed / 1e9),
+            })
+            log(
+                f"contention shards={shard_count} threads={thread_count}: "
+                f"{results[-1]['per_second']:.0f} ops/s"
+            )
+    return results
+
+
+def _contention_workload(items, count, read_ratio, seed):
+    rng = random.Random(f"{seed}-contention")
+    return [
+        (rng.random() < read_ratio, *rng.choice(items))
+        for _ in range(count)
+    ]
+
+
+def _run_operations(table, workload, barrier):
+    search = table.search
+    insert = table.insert
+    barrier.wait()
+    for is_read, key, value in workload:
+        if is_read:
+            search(key)
+        else:
+            insert(key, value)
+
+
+def plot_results(results, path, hit_ratio=None):
+    """
+    Plots build throughput, search latency and memory against the size.
+
+    Args:
+        results (dict): Output of run_benchmark.
+        path (str): The image file.
+        hit_ratio (float): Which search workload to plot, the first by default.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, (build_ax, search_ax, memory_ax) = plt.subplots(1, 3, figsize=(15, 4.5))
+    names = list(dict.fromkeys(r["structure"] for r in results["results"]))
+    for name in names:
+        rows = [r for r in results["results"] if r["structure"] == name]
+        sizes = [r["size"] for r in rows]
+        searches = [
+            next(
+                s for s in r["search"]
+                if hit_ratio is None or s["hit_ratio"] == hit_ratio
+            )
+            for r in rows
+        ]
+        build_ax.plot(sizes, [r["build_per_second"] for r in rows], label=name)
+        search_ax.plot(sizes, [s["p50_ns"] for s in searches], label=name)
+        memory_ax.plot(sizes, [r["bytes_per_entry"] for r in rows], label=name)
+
+    for ax, ylabel in (
+        (build_ax, "Pairs built per second"),
+        (search_ax, "Median search latency, ns"),
+        (memory_ax, "Bytes per entry"),
+    ):
+        ax.set_xscale("log")
+        ax.set_xlabel("Array Size")
+        ax.set_ylabel(ylabel)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search structures benchmark")
+    parser.add_argument("--structures", nargs="+", choices=list(STRUCTURES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--hit-ratios", nargs="+", type=float, default=[1.0, 0.5, 0.0])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bulk", action="store_true", help="build the trees with from_items")
+    parser.add_argument("--output", default="bench.json")
+    parser.add_argument("--plot", metavar="IMAGE")
+    parser.add_argument("--contention", action="store_true", help="also run the thread scaling benchmark")
+    parser.add_argument("--threads", nargs="+", type=int, default=THREADS)
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        structures=args.structures,
+        sizes=args.sizes,
+        queries=args.queries,
+        hit_ratios=args.hit_ratios,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        seed=args.seed,
+        bulk=args.bulk,
+    )
+    if args.contention:
+        results["contention"] = run_contention(
+            size=max(args.sizes),
+            threads=args.threads,
+            read_ratio=args.read_ratio,
+            seed=args.seed,
+        )
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    if args.plot:
+        plot_results(results, args.plot)
+
+
+if __name__ == "__main__":
+    main()
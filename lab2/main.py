@@ -1,92 +1,37 @@
-import random
-import time
 import matplotlib.pyplot as plt
 
-from algos.bin_tree import BinarySearchTree
-from data.gen import generate_objects_array, generate_combinations
-from algos.hash import HashTable
-from algos.red_black_tree import RedBlackTree
-from algos.multimap import MultiMap
+from benchmark import STRUCTURES, run_benchmark
 
 from loguru import logger
 
-import sys
-sys.setrecursionlimit(20000)
 logger.add('main.log')
 
+LABELS = {
+    "binary_tree": "Binary Tree",
+    "red_black_tree": "Red Black Tree",
+    "b_plus_tree": "B+ Tree",
+    "hash_table": "Hash Table",
+    "open_hash_table": "Open Hash Table",
+    "multimap": "Multimap Table",
+    "direct_multimap": "Direct Multimap",
+}
+
 
 # Сравнительное время поиска на разных размерностях массива
 def compare_search_time(sizes):
-    binary_tree_time = []
-    red_black_tree_time = []
-    hashtable_time = []
-    multimap_time = []
-    keys = generate_combinations()
-
-    for size in sizes:
-        objects = generate_objects_array(size)
-        key = random.choice(keys)
-
-        logger.info(f'{size} - {key}')
-
-        binary_tree = BinarySearchTree()
-        for obj in objects:
-            try:
-                binary_tree.insert(obj["key"], obj["value"])
-            except Exception:
-                break
-
-        binary_tree_start_time = time.time()
-        try:
-            binary_tree.search(key)
-        except Exception:
-            logger.error('Max recursion depth')
-        binary_tree_end_time = time.time()
-        binary_tree_time.append(binary_tree_end_time - binary_tree_start_time)
-
-        logger.info(f'Binary time: {binary_tree_time[-1]}')
-
-        hashtable = HashTable(size)
-        for obj in objects:
-            hashtable.insert(obj["key"], obj["value"])
-
-        hashtable_start_time = time.time()
-
-        rnd_obj = random.choice(objects)
-        hashtable.search_value(rnd_obj["key"], rnd_obj["value"])
-        hashtable_end_time = time.time()
-        hashtable_time.append(hashtable_end_time - hashtable_start_time)
-
-        logger.info(f'Hash time: {hashtable_time[-1]}')
-
-        red_black_tree = RedBlackTree()
-        for obj in objects:
-            red_black_tree.insert(obj["key"], obj["value"])
-
-        red_black_tree_start_time = time.time()
-        red_black_tree.search(key)
-        red_black_tree_end_time = time.time()
-        red_black_tree_time.append(
-            red_black_tree_end_time - red_black_tree_start_time
+    # Одни и те же ключи для всех структур, медиана по тысячам поисков;
+    # деревья строятся из массива пар через from_items
+    results = run_benchmark(sizes=sizes, hit_ratios=(1.0,), bulk=True, log=logger.info)
+
+    for name in STRUCTURES:
+        rows = [r for r in results["results"] if r["structure"] == name]
+        plt.plot(
+            [r["size"] for r in rows],
+            [r["search"][0]["p50_ns"] for r in rows],
+            label=LABELS.get(name, name),
         )
-
-        logger.info(f'Red black tree time: {red_black_tree_time[-1]}')
-
-        multimap = MultiMap()
-        for obj in objects:
-            multimap.insert(obj["key"], obj["value"])
-
-        multimap_start_time = time.time()
-        multimap.search(key)
-        multimap_end_time = time.time()
-        multimap_time.append(multimap_end_time - multimap_start_time)
-
-    plt.plot(sizes, binary_tree_time, label="Binary Tree")
-    plt.plot(sizes, red_black_tree_time, label="Red Black Tree")
-    plt.plot(sizes, hashtable_time, label="Hash Table")
-    plt.plot(sizes, multimap_time, label="Multimap Table")
     plt.xlabel("Array Size")
-    plt.ylabel("Search Time")
+    plt.ylabel("Search Time, ns")
     plt.legend()
     plt.savefig("plot.png")
     plt.show()
@@ -1,16 +1,16 @@
 import matplotlib.pyplot as plt
 
-from algos.hash import count_collisions
+from algos.hash_quality import METHODS, run_analysis
 
 
 sizes = [100, 1000, 5000, 10000, 50000, 75000, 100000]
-collisions = []
+# Все хэш-функции считаются векторно, по size ключей на таблицу из size корзин
+report = run_analysis(sizes)
 
-for size in sizes:
-    col = count_collisions(size)
-    collisions.append(col)
+for method in METHODS:
+    collisions = [report[size][method]["entries"]["collisions"] for size in sizes]
+    plt.plot(sizes, collisions, label=method)
 
-plt.plot(sizes, collisions, label="Collisions")
 plt.xlabel("Array Size")
 plt.ylabel("Collisions")
 plt.legend()
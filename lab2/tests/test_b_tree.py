@@ -0,0 +1,89 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from algos.b_tree import BPlusTree
+from benchmark import make_items, make_queries
+
+
+def _reference(items):
+    values = defaultdict(list)
+    for key, value in items:
+        values[key].append(value)
+    return values
+
+
+def _check(tree, items):
+    reference = _reference(items)
+    assert len(tree) == len(items)
+    assert tree.size == len(reference)
+    assert list(tree.keys()) == sorted(reference)
+    assert list(tree) == [(key, value) for key in sorted(reference) for value in reference[key]]
+    for key in reference:
+        assert tree.search(key) == reference[key]
+
+
+@pytest.mark.parametrize("order", [3, 4, 64])
+@pytest.mark.parametrize("size", [0, 1, 100, 5000])
+def test_insert_and_from_items_match_dict(order, size):
+    items = make_items(size, seed=order)
+
+    tree = BPlusTree(order)
+    for key, value in items:
+        tree.insert(key, value)
+    _check(tree, items)
+    _check(BPlusTree.from_items(items, order=order), items)
+
+
+@pytest.mark.parametrize("order", [3, 5, 64])
+@pytest.mark.parametrize("hit_ratio", [1.0, 0.5, 0.0])
+def test_search_many_matches_search(order, hit_ratio):
+    items = make_items(3000, seed=1)
+    tree = BPlusTree.from_items(items, order=order)
+    reference = _reference(items)
+
+    queries = make_queries(items, 2000, hit_ratio, seed=2)
+    found = tree.search_many(queries)
+    assert set(found) == set(queries)
+    for key in queries:
+        assert found[key] == reference.get(key, [])
+
+
+@pytest.mark.parametrize("order", [3, 8])
+def test_search_many_after_inserts(order):
+    rng = random.Random(order)
+    numbers = [rng.randrange(10000) for _ in range(5000)]
+    tree = BPlusTree(order)
+    for i, number in enumerate(numbers):
+        tree.insert(number, i)
+    reference = _reference((number, i) for i, number in enumerate(numbers))
+
+    # Ключи подряд, с разрывами через несколько листов и за пределами дерева
+    for keys in (
+        list(range(-5, 200)),
+        list(range(0, 10000, 37)),
+        [rng.randrange(-100, 10100) for _ in range(500)],
+        [],
+    ):
+        found = tree.search_many(keys)
+        assert found == {key: reference.get(key, []) for key in keys}
+
+
+def test_range_matches_sorted():
+    items = make_items(2000, seed=3)
+    tree = BPlusTree.from_items(items, order=4)
+    ordered = sorted(items, key=lambda item: item[0])
+    for lo, hi in [(None, None), ("b", "d"), ("ab", "ab"), ("zz", None), (None, "a"), ("q", "c")]:
+        expected = [
+            (key, value) for key, value in ordered
+            if (lo is None or lo <= key) and (hi is None or key <= hi)
+        ]
+        assert list(tree.range(lo, hi)) == expected
+
+
+def test_presorted_checks_order():
+    with pytest.raises(ValueError):
+        BPlusTree.from_items([("b", 1), ("a", 2)], presorted=True)
+    with pytest.raises(ValueError):
+        BPlusTree(2)
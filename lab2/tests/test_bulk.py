@@ -0,0 +1,99 @@
+from collections import defaultdict
+
+import pytest
+
+from algos.bin_tree import BinarySearchTree
+from algos.bulk import group_items, merge_groups
+from algos.red_black_tree import BLACK, RED, RedBlackTree
+from benchmark import make_items
+
+
+def _groups(items):
+    values = defaultdict(list)
+    for key, value in items:
+        values[key].append(value)
+    return sorted(values.items())
+
+
+def _black_height(tree, node):
+    # Проверяет свойства красно-черного дерева и счетчики поддеревьев
+    if node is tree.NIL:
+        return 1
+    assert node.left is tree.NIL or node.left.parent is node
+    assert node.right is tree.NIL or node.right.parent is node
+    if node.color == RED:
+        assert node.left.color == BLACK and node.right.color == BLACK
+    assert node.count == len(node.values) + node.left.count + node.right.count
+    left = _black_height(tree, node.left)
+    assert left == _black_height(tree, node.right)
+    return left + (node.color == BLACK)
+
+
+def _check(tree, items):
+    groups = _groups(items)
+    assert tree.size == len(groups)
+    assert tree.search_many([key for key, _ in groups] + ["missing"]) == {
+        **dict(groups), "missing": []
+    }
+    if isinstance(tree, RedBlackTree):
+        assert tree.root.color == BLACK
+        _black_height(tree, tree.root)
+        assert list(tree) == [(key, value) for key, values in groups for value in values]
+
+
+def test_group_and_merge():
+    items = [("b", 1), ("a", 2), ("b", 3), ("c", 4), ("a", 5)]
+    assert group_items(items) == [("a", [2, 5]), ("b", [1, 3]), ("c", [4])]
+    assert group_items(sorted(items), presorted=True) == group_items(items)
+    with pytest.raises(ValueError):
+        group_items(items, presorted=True)
+
+    old = [("a", [1]), ("c", [2])]
+    new = [("b", [3]), ("c", [4]), ("d", [5])]
+    assert merge_groups(old, new) == [("a", [1]), ("b", [3]), ("c", [2, 4]), ("d", [5])]
+
+
+@pytest.mark.parametrize("cls", [BinarySearchTree, RedBlackTree])
+@pytest.mark.parametrize("size", [0, 1, 2, 7, 100, 5000])
+def test_from_items_matches_inserts(cls, size):
+    items = make_items(size, seed=size)
+    _check(cls.from_items(items), items)
+
+    tree = cls()
+    for key, value in items:
+        tree.insert(key, value)
+    _check(tree, items)
+
+
+@pytest.mark.parametrize("cls", [BinarySearchTree, RedBlackTree])
+@pytest.mark.parametrize("batch", [1, 10, 3000])
+def test_bulk_insert(cls, batch):
+    items = make_items(2000, seed=1)
+    extra = make_items(batch, seed=2)
+    tree = cls.from_items(items)
+    tree.bulk_insert(extra)
+    _check(tree, items + extra)
+
+    # Небольшие пачки вставляются по одной паре, дерево остается корректным
+    if isinstance(tree, RedBlackTree):
+        tree.insert("zzz", 1)
+        _black_height(tree, tree.root)
+
+
+def test_red_black_order_statistics():
+    items = make_items(3000, seed=5)
+    tree = RedBlackTree.from_items(items)
+    tree.bulk_insert(make_items(50, seed=6))
+    ordered = list(tree)
+    keys = [key for key, _ in ordered]
+
+    assert len(tree) == len(ordered)
+    for i in (0, 1, 100, len(ordered) - 1, -1):
+        assert tree.select(i) == ordered[i]
+    for key in ("aa", "mm", "zz", "zzz", "a"):
+        assert tree.rank(key) == sum(k < key for k in keys)
+    assert tree.count_range("c", "f") == sum("c" <= k <= "f" for k in keys)
+    assert tree.count_range("f", "c") == 0
+    assert list(tree.range("c", "f")) == [(k, v) for k, v in ordered if "c" <= k <= "f"]
+    with pytest.raises(IndexError):
+        tree.select(len(ordered))
@@ -0,0 +1,53 @@
+import threading
+
+from algos.concurrent import ConcurrentHashTable, ProcessShardedHashTable
+from algos.hash import HashTable
+from benchmark import make_items, make_queries
+
+
+def _reference(items):
+    table = HashTable(1000)
+    for key, value in items:
+        table.insert(key, value)
+    return table
+
+
+def test_concurrent_inserts_match_hash_table():
+    items = make_items(20000, seed=1)
+    table = ConcurrentHashTable(1000, shards=8)
+    parts = [items[i::4] for i in range(4)]
+    workers = [threading.Thread(target=table.insert_many, args=(part,)) for part in parts]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert sum(len(bucket) for shard in table.shards for bucket in shard.table) == len(items)
+    reference = _reference(items)
+    queries = make_queries(items, 2000, 0.5, seed=2)
+    found = table.search_many(queries)
+    assert set(found) == set(queries)
+    for key in queries:
+        # Порядок вставки между потоками не задан, поэтому сверяется наличие
+        assert (found[key] is None) == (reference.search(key) is None)
+        assert table.search(key) == found[key]
+    for key, value in items[:500]:
+        assert table.search_value(key, value) == value
+
+
+def test_single_thread_matches_hash_table():
+    items = make_items(5000, seed=3)
+    table = ConcurrentHashTable(1000)
+    for key, value in items:
+        table.insert(key, value)
+    queries = make_queries(items, 1000, 0.5, seed=4)
+    assert table.search_many(queries) == _reference(items).search_many(queries)
+
+
+def test_process_sharded_table():
+    items = make_items(5000, seed=5)
+    queries = make_queries(items, 1000, 0.5, seed=6)
+    with ProcessShardedHashTable(1000, workers=3) as table:
+        table.insert_many(items)
+        assert table.search_many(queries) == _reference(items).search_many(queries)
+        assert table.search(items[0][0]) == _reference(items).search(items[0][0])
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from algos.hash import HashTable
+from algos.hash_quality import METHODS, analyze, bucket_indices, bucket_stats, sample_keys
+
+KEYS = np.array(["ab", "zz", "a", "abc", "ключ", "x" * 20, "ab"])
+
+
+def _fnv1a(key):
+    h = 0xCBF29CE484222325
+    for byte in key.encode("utf-8"):
+        h = (h ^ byte) * 0x100000001B3 % 2**64
+    return h
+
+
+@pytest.mark.parametrize("size", [1, 7, 1000])
+def test_buckets_match_scalar_hashes(size):
+    table = HashTable(size)
+    keys = KEYS.tolist()
+    assert bucket_indices(KEYS, size, "builtin").tolist() == [table.hash_function(k) for k in keys]
+    assert bucket_indices(KEYS, size, "polynomial").tolist() == [
+        table.hash_function_custom(k) for k in keys
+    ]
+    assert bucket_indices(KEYS, size, "fnv1a").tolist() == [_fnv1a(k) % size for k in keys]
+
+    buckets = bucket_indices(KEYS, size, "multiply_shift", seed=3)
+    assert ((0 <= buckets) & (buckets < size)).all()
+    assert buckets[0] == buckets[-1]
+
+
+def test_bucket_stats():
+    stats = bucket_stats(np.array([0, 0, 1, 3, 3, 3]), 4)
+    assert stats["entries"] == 6
+    # Коллизия - запись в уже занятую корзину
+    assert stats["collisions"] == 3
+    assert stats["max_chain"] == 3
+    assert stats["chi2"] == pytest.approx(sum((n - 1.5) ** 2 / 1.5 for n in [2, 1, 0, 3]))
+
+
+def test_analyze_report():
+    keys = sample_keys(5000, seed=1)
+    report = analyze(keys, 500)
+    assert sorted(report) == sorted(METHODS)
+    distinct = len(np.unique(keys))
+    for method in METHODS:
+        assert report[method]["entries"]["entries"] == 5000
+        assert report[method]["keys"]["entries"] == distinct
+        buckets = bucket_indices(keys, 500, method)
+        assert report[method]["entries"] == bucket_stats(buckets, 500)
+
+    with pytest.raises(ValueError):
+        analyze(keys, 500, methods=["unknown"])
@@ -0,0 +1,94 @@
+import pytest
+
+from algos.multimap import BitSet, DirectMultiMap, MultiMap, two_letter_index
+from benchmark import make_items, make_queries
+from data.gen import generate_combinations
+
+
+def test_two_letter_index():
+    keys = generate_combinations()
+    assert [two_letter_index(key) for key in keys] == list(range(len(keys)))
+    for key in ["", "a", "abc", "Ab", "a{", "`a", "ая", 'a"']:
+        assert two_letter_index(key) == -1
+
+
+@pytest.mark.parametrize("size", [0, 100, 10000])
+def test_matches_multimap(size):
+    items = make_items(size, seed=size)
+    direct = DirectMultiMap()
+    reference = MultiMap()
+    for key, value in items:
+        direct.insert(key, value)
+        reference.insert(key, value)
+
+    assert len(direct) == sum(len(values) for values in reference.multi_map.values())
+    queries = make_queries(items, 500, 0.5, seed=1) if items else ["ab", "abc"]
+    for key in queries:
+        assert direct.search(key) == reference.search(key)
+        assert set(direct.search(key)) == reference.search(key)
+        for value in (0, 1, 50, 100, 101):
+            assert direct.contains(key, value) == (value in reference.search(key))
+    assert direct.search_many(queries) == reference.search_many(queries)
+
+
+def test_search_is_a_live_view():
+    multimap = DirectMultiMap()
+    values = multimap.search("ab")
+    multimap.insert("ab", 3)
+    assert 3 in values
+    assert multimap.search("zz") == set()
+    assert multimap.search("missing") == set()
+
+
+def test_custom_universe():
+    multimap = DirectMultiMap(["ab", "AB", "long key", "ключ"])
+    multimap.insert("ab", 1)
+    multimap.insert("AB", 2)
+    multimap.insert("long key", 3)
+    multimap.insert("ключ", 4)
+    assert multimap.search("ab") == {1}
+    assert multimap.search("AB") == {2}
+    assert multimap.search("long key") == {3}
+    assert multimap.search("ключ") == {4}
+    assert multimap.mask("ab") == 0b10
+    assert len(multimap) == 4
+
+    # Двухбуквенный ключ вне вселенной так же чужой, как и любой другой
+    for key in ("cd", "other"):
+        with pytest.raises(KeyError):
+            multimap.insert(key, 1)
+        assert multimap.search(key) == set()
+        assert not multimap.contains(key, 1)
+
+
+def test_invalid_values():
+    multimap = DirectMultiMap()
+    with pytest.raises(ValueError):
+        multimap.insert("ab", -1)
+    assert not multimap.contains("ab", -1)
+
+
+def test_union_and_intersection():
+    multimap = DirectMultiMap()
+    for key, values in {"ab": [1, 2, 3], "cd": [2, 3, 4], "ef": [3, 100]}.items():
+        for value in values:
+            multimap.insert(key, value)
+
+    assert multimap.union(["ab", "cd"]) == {1, 2, 3, 4}
+    assert multimap.intersection(["ab", "cd", "ef"]) == {3}
+    assert multimap.intersection(["ab", "zz"]) == set()
+    assert multimap.intersection([]) == set()
+    assert multimap.union(["ab", "missing"]) == {1, 2, 3}
+
+
+def test_bitset():
+    values = {0, 5, 64, 1000}
+    bits = BitSet._from_iterable(values)
+    assert list(bits) == sorted(values)
+    assert len(bits) == len(values)
+    assert bits == values
+    assert 64 in bits and 63 not in bits and -1 not in bits and "a" not in bits
+    assert (bits & BitSet._from_iterable({5, 6})) == {5}
+    assert (bits | BitSet._from_iterable({6})) == values | {6}
+    assert (bits & {0, 7}) == {0}
+    assert (bits - {0}) == values - {0}
@@ -0,0 +1,75 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from algos.hash import HashTable
+from algos.open_hash import MIN_CAPACITY, OpenHashTable
+from benchmark import make_items, make_queries
+
+
+def _check(table, reference):
+    assert len(table) == sum(len(values) for values in reference.values())
+    for key, values in reference.items():
+        assert key in table
+        assert table.search(key) == values[0]
+        assert table.search_all(key) == values
+    assert table.used == len(reference)
+    assert table.load_factor <= 0.85
+
+
+@pytest.mark.parametrize("size", [0, 1, 100, 10000])
+def test_matches_hash_table(size):
+    items = make_items(size, seed=size)
+    table = OpenHashTable(size)
+    chained = HashTable(max(size, 1))
+    for key, value in items:
+        table.insert(key, value)
+        chained.insert(key, value)
+
+    queries = make_queries(items, 500, 0.5, seed=1) if items else ["ab"]
+    for key in queries:
+        assert table.search(key) == chained.search(key)
+        assert table.search_value(key, 7) == chained.search_value(key, 7)
+    assert table.search_many(queries) == chained.search_many(queries)
+
+
+def test_random_operations_match_dict():
+    rng = random.Random(3)
+    table = OpenHashTable()
+    reference = defaultdict(list)
+    for step in range(20000):
+        key = rng.randrange(2000)
+        operation = rng.random()
+        if operation < 0.6:
+            table.insert(key, step)
+            reference[key].append(step)
+        elif operation < 0.8 and reference:
+            key = rng.choice(list(reference))
+            assert table.delete(key) == reference.pop(key)
+        elif reference:
+            key = rng.choice(list(reference))
+            value = rng.choice(reference[key])
+            table.remove(key, value)
+            reference[key].remove(value)
+            if not reference[key]:
+                del reference[key]
+        else:
+            assert table.search(key) is None
+    _check(table, reference)
+
+    for key in list(reference):
+        table.delete(key)
+    assert len(table) == 0
+    assert table.capacity == MIN_CAPACITY
+
+
+def test_missing_keys():
+    table = OpenHashTable()
+    table.insert("ab", 1)
+    assert table.search("cd") is None
+    assert table.search_all("cd") == []
+    with pytest.raises(KeyError):
+        table.delete("cd")
+    with pytest.raises(KeyError):
+        table.remove("cd", 1)
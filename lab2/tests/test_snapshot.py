@@ -0,0 +1,68 @@
+import pytest
+
+from algos.hash import HashTable
+from algos.multimap import MultiMap
+from algos.snapshot import HASH_TABLE, MULTIMAP, MappedIndex, write_snapshot
+from benchmark import make_items, make_queries
+
+
+def test_index_round_trip(tmp_path):
+    path = str(tmp_path / "index.bin")
+    groups = [("ab", [1, 2]), ("ключ", [-(2**63), 2**63 - 1]), ("", [0]), ("cd", [])]
+    write_snapshot(path, groups, MULTIMAP, buckets=3)
+
+    with MappedIndex(path, MULTIMAP) as index:
+        assert len(index) == len(groups)
+        assert sorted(index.groups()) == sorted(groups)
+        for key, values in groups:
+            assert index.values(index.find(key)).tolist() == values
+        assert index.find("missing") == -1
+
+
+def test_kind_and_truncation_are_checked(tmp_path):
+    path = str(tmp_path / "index.bin")
+    write_snapshot(path, [("ab", [1])], HASH_TABLE)
+    with pytest.raises(ValueError):
+        MappedIndex(path, MULTIMAP)
+
+    with open(path, "rb") as file:
+        data = file.read()
+    with open(path, "wb") as file:
+        file.write(data[:-1])
+    with pytest.raises(ValueError):
+        MappedIndex(path, HASH_TABLE)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_hash_table_snapshot(tmp_path, mmap):
+    path = str(tmp_path / "table.bin")
+    items = make_items(2000, seed=1)
+    table = HashTable(500)
+    for key, value in items:
+        table.insert(key, value)
+    table.save(path)
+
+    loaded = HashTable.load(path, mmap=mmap)
+    queries = make_queries(items, 500, 0.5, seed=2)
+    assert loaded.search_many(queries) == table.search_many(queries)
+    for key, value in items[:200]:
+        assert loaded.search_value(key, value) == value
+        assert loaded.search_value(key, 1000) is None
+    if mmap:
+        loaded.close()
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_multimap_snapshot(tmp_path, mmap):
+    path = str(tmp_path / "multimap.bin")
+    items = make_items(2000, seed=3)
+    multimap = MultiMap()
+    for key, value in items:
+        multimap.insert(key, value)
+    multimap.save(path)
+
+    loaded = MultiMap.load(path, mmap=mmap)
+    queries = make_queries(items, 500, 0.5, seed=4)
+    assert loaded.search_many(queries) == multimap.search_many(queries)
+    if mmap:
+        loaded.close()
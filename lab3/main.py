@@ -16,6 +16,27 @@ class SimpleRandom:
         return self.seed % 100
 
 
+# Число состояний в строке блока random_batch
+BATCH_BLOCK = 4096
+BATCH_ROWS = 256
+
+
+def affine_power(a, c, m, k):
+    """
+    Returns (A, C) such that k LCG steps map x to (A * x + C) % m.
+
+    The step is squared by repeated doubling, so the cost is O(log k)
+    and no modular inverse of a - 1 is needed.
+    """
+    A, C = 1, 0
+    while k:
+        if k & 1:
+            A, C = A * a % m, (C * a + c) % m
+        a, c = a * a % m, (a * c + c) % m
+        k >>= 1
+    return A, C
+
+
 # Линейный конгруэнтный генератор (LCG)
 class LCG:
     def __init__(self, seed=1, a=1664525, c=1013904223, m=2**32):
@@ -23,21 +44,96 @@ class LCG:
         self.a = a
         self.c = c
         self.m = m
-        self.state = seed
+        # Состояние всегда в [0, m), как после любого шага
+        self.state = seed % m
 
     def random(self):
         self.state = (self.a * self.state + self.c) % self.m
         return self.state / self.m
 
+    def skip(self, k):
+        """Advances the generator by k steps in O(log k)."""
+        A, C = affine_power(self.a, self.c, self.m, k)
+        self.state = (A * self.state + C) % self.m
+
+    def jump(self, k):
+        """Returns a new generator k steps ahead; this one is not changed."""
+        other = LCG(self.state, self.a, self.c, self.m)
+        other.skip(k)
+        return other
+
+    def random_batch(self, n):
+        """
+        Returns the next n numbers as a float64 NumPy array.
+
+        The numbers are identical to n calls of random. States are
+        computed as a matrix: row r starts at state x_(rB), and column j
+        holds A_j * x_(rB) + C_j, with the jump coefficients A_j, C_j of
+        j = 1..B steps precomputed once. The products fit into uint64 for
+        m <= 2**32; for a larger modulus the numbers are generated one by
+        one.
+        """
+        if self.m > 2**32:
+            return np.fromiter((self.random() for _ in range(n)), np.float64, n)
+
+        A, C = self._block_coefficients()
+        block = len(A)
+        A_block, C_block = int(A[-1]), int(C[-1])
+        m = np.uint64(self.m)
+        power_of_two = self.m & (self.m - 1) == 0
+        out = np.empty(n, dtype=np.float64)
+
+        rows = -(-n // block)
+        for first in range(0, rows, BATCH_ROWS):
+            count = min(BATCH_ROWS, rows - first)
+            # Начальные состояния строк - шаги по B
+            starts = np.empty(count, dtype=np.uint64)
+            state = self.state % self.m
+            for r in range(count):
+                starts[r] = state
+                state = (A_block * state + C_block) % self.m
+            states = np.multiply.outer(starts, A)
+            states += C
+            if power_of_two:
+                # Для m = 2^k остаток - это маска
+                states &= m - np.uint64(1)
+            else:
+                states %= m
+
+            start = first * block
+            flat = states.ravel()[:n - start]
+            np.divide(flat, float(self.m), out=out[start:start + len(flat)])
+            self.state = int(flat[-1])
+        return out
+
+    def _block_coefficients(self):
+        key = (self.a, self.c, self.m)
+        if getattr(self, "_block_key", None) != key:
+            A = np.empty(BATCH_BLOCK, dtype=np.uint64)
+            C = np.empty(BATCH_BLOCK, dtype=np.uint64)
+            a_j, c_j = 1, 0
+            for j in range(BATCH_BLOCK):
+                a_j, c_j = a_j * self.a % self.m, (c_j * self.a + self.c) % self.m
+                A[j] = a_j
+                C[j] = c_j
+            self._block_key = key
+            self._block = (A, C)
+        return self._block
+
 
 # Генерация выборок
 def generate_samples(
     generator, num_samples=20, sample_size=100, range_min=0, range_max=4999
 ):
     samples = []
+    span = range_max - range_min + 1
     for _ in range(num_samples):
+        if hasattr(generator, "random_batch"):
+            batch = generator.random_batch(sample_size) * span + range_min
+            samples.append(batch.astype(np.int64).tolist())
+            continue
         sample = [
-            int(generator.random() * (range_max - range_min + 1) + range_min)
+            int(generator.random() * span + range_min)
             for _ in range(sample_size)
         ]
         samples.append(sample)
@@ -80,6 +176,17 @@ def benchmark(generator, sizes):
     return times
 
 
+# Проверка времени блочной генерации
+def benchmark_batch(generator, sizes):
+    times = []
+    for size in sizes:
+        print(f"Benchmarked batch: {size}")
+        start_time = time.perf_counter()
+        generator.random_batch(size)
+        times.append(time.perf_counter() - start_time)
+    return times
+
+
 # Вывод статистики
 def print_statistics(generator_name, statistics, chi2_results):
     print(f"\nStatistics for {generator_name}:")
@@ -167,6 +274,7 @@ def main():
     lcg_times = benchmark(lcg, sizes)
     custom_mt_times = benchmark(simple_rnd, sizes)
     np_times = benchmark(np.random, sizes)
+    lcg_batch_times = benchmark_batch(lcg, sizes)
 
     print("NIST TEST FOR 10 000")
     run_nist_tests([round(lcg.random() * 100) for _ in range(10000)])
@@ -181,6 +289,7 @@ def main():
     plt.plot(sizes, lcg_times, label="LCG")
     plt.plot(sizes, custom_mt_times, label="Simple Random")
     plt.plot(sizes, np_times, label="NumPy Random")
+    plt.plot(sizes, lcg_batch_times, label="LCG (batch)")
     plt.xlabel("Size of Samples")
     plt.ylabel("Generation Time (seconds)")
     plt.legend()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from main import LCG
+
+
+def sequential(generator, n):
+    return np.array([generator.random() for _ in range(n)], dtype=np.float64)
+
+
+@pytest.mark.parametrize(
+    "seed, m",
+    [
+        (12345, 2**32),
+        (-1, 2**32),
+        (-(2**40) - 7, 2**32),
+        (2**35, 2**32),
+        (2**35, 2**31 - 1),
+        (-5, 2**31 - 1),
+        (10**30, 1000),
+    ],
+)
+@pytest.mark.parametrize("n", [0, 1, 4095, 4096, 4097, 20000])
+def test_random_batch_matches_random(seed, m, n):
+    batch_generator = LCG(seed, m=m)
+    sequential_generator = LCG(seed, m=m)
+
+    batch = batch_generator.random_batch(n)
+
+    assert batch.tobytes() == sequential(sequential_generator, n).tobytes()
+    assert batch_generator.state == sequential_generator.state
+
+
+@pytest.mark.parametrize("state", [-3, 2**35])
+def test_random_batch_reduces_assigned_state(state):
+    batch_generator = LCG(m=2**31 - 1)
+    sequential_generator = LCG(m=2**31 - 1)
+    batch_generator.state = sequential_generator.state = state
+
+    batch = batch_generator.random_batch(5000)
+
+    assert batch.tobytes() == sequential(sequential_generator, 5000).tobytes()
+
+
+@pytest.mark.parametrize("seed", [-7, 3, 2**40])
+def test_jump_and_skip_match_stepping(seed):
+    stepped = LCG(seed)
+    jumped = stepped.jump(12345)
+    sequential(stepped, 12345)
+
+    assert jumped.state == stepped.state
+
+    skipped = LCG(seed)
+    skipped.skip(12345)
+    assert skipped.state == stepped.state
+
+
+def test_large_modulus_falls_back_to_sequential():
+    params = dict(a=6364136223846793005, c=1442695040888963407, m=2**64)
+    batch = LCG(-42, **params).random_batch(1000)
+
+    assert batch.tobytes() == sequential(LCG(-42, **params), 1000).tobytes()